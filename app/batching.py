@@ -0,0 +1,116 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+class MicroBatcher:
+    """
+    Groups concurrent prediction requests into one vectorized predict call.
+
+    Callers submit ``[n, 8]`` feature matrices. A background task collects them until
+    ``max_batch_size`` rows are queued or ``max_wait_us`` microseconds have passed since the
+    first one arrived, stacks them, awaits ``predict_fn`` once and hands every caller its rows back.
+    ``predict_fn`` returns ``(predictions, model_version)`` so callers learn which model scored them.
+    Batches are dispatched as tasks, so the next batch is collected while the previous one runs.
+    """
+
+    def __init__(self, predict_fn: Callable[[np.ndarray], Awaitable[Tuple[np.ndarray, str]]],
+                 max_batch_size: int = 64, max_wait_us: int = 2000):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_us / 1_000_000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+        self._pending_rows = 0
+
+    @property
+    def pending(self) -> int:
+        """Requests waiting to be picked into a batch."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def pending_rows(self) -> int:
+        """Feature rows in the requests waiting to be picked into a batch."""
+        return self._pending_rows
+
+    @property
+    def pending_batches(self) -> int:
+        """Batches the waiting rows will fill, counting a partial batch as a whole one."""
+        return -(-self._pending_rows // self.max_batch_size)
+
+    def _take(self, item: Tuple[np.ndarray, asyncio.Future]) -> Tuple[np.ndarray, asyncio.Future]:
+        self._pending_rows -= len(item[0])
+        return item
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop collecting and score whatever is still queued, so no caller is left waiting."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        remaining = []
+        while self._queue is not None and not self._queue.empty():
+            remaining.append(self._take(self._queue.get_nowait()))
+        if remaining:
+            await self._dispatch(remaining)
+        # Batches already handed to predict_fn still owe their callers a result
+        await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def submit(self, features: np.ndarray) -> Tuple[np.ndarray, str]:
+        """Queue ``features`` for the next batch and wait for its predictions and model version."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending_rows += len(features)
+        await self._queue.put((features, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        item = self._take(await self._queue.get())
+        batch = [item]
+        rows = len(item[0])
+        deadline = time.monotonic() + self.max_wait
+
+        while rows < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._take(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[np.ndarray, asyncio.Future]]) -> None:
+        try:
+            predictions, model_version = await self.predict_fn(np.vstack([features for features, _ in batch]))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for features, future in batch:
+            end = offset + len(features)
+            if not future.done():
+                future.set_result((predictions[offset:end], model_version))
+            offset = end
@@ -0,0 +1,149 @@
+"""
+KServe v2 gRPC endpoint served next to the REST routes.
+
+The servicer is handed the app's own inference and metadata functions, so both protocols share
+the model registry, micro-batchers, prediction cache, inference pool and metrics. Inputs may be
+sent as packed ``raw_input_contents`` (the fast path, decoded with ``np.frombuffer``) or as typed
+``contents``; the prediction always goes back as packed little-endian FP32 in ``raw_output_contents``.
+"""
+import logging
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+import grpc
+import numpy as np
+
+import grpc_predict_v2_pb2 as pb
+import grpc_predict_v2_pb2_grpc as pb_grpc
+import metrics
+from inference_pool import Overloaded
+from model_registry import ModelNotFound
+from model_store import ModelNotReady
+from tensor_codec import V2_DATATYPES
+
+logger = logging.getLogger(__name__)
+
+# Typed ``InferTensorContents`` field holding each v2 datatype
+CONTENTS_FIELDS = {
+    "BOOL": "bool_contents",
+    "INT8": "int_contents", "INT16": "int_contents", "INT32": "int_contents", "INT64": "int64_contents",
+    "UINT8": "uint_contents", "UINT16": "uint_contents", "UINT32": "uint_contents", "UINT64": "uint64_contents",
+    "FP32": "fp32_contents", "FP64": "fp64_contents",
+}
+
+SERVICE = "inference.GRPCInferenceService"
+
+
+def decode_inputs(request: pb.ModelInferRequest) -> List[dict]:
+    """Turn the request's input tensors into the ``{"name", "shape", "data"}`` layout ``parse_inputs`` reads."""
+    if request.raw_input_contents and len(request.raw_input_contents) != len(request.inputs):
+        raise ValueError("raw_input_contents must hold one entry per input tensor")
+
+    tensors = []
+    for i, tensor in enumerate(request.inputs):
+        if request.raw_input_contents:
+            dtype = V2_DATATYPES.get(tensor.datatype)
+            if dtype is None:
+                raise ValueError(f"Unsupported datatype: {tensor.datatype}")
+            data = np.frombuffer(request.raw_input_contents[i], dtype=dtype)
+        else:
+            field = CONTENTS_FIELDS.get(tensor.datatype)
+            if field is None:
+                raise ValueError(f"Unsupported datatype: {tensor.datatype}")
+            data = np.asarray(getattr(tensor.contents, field))
+        shape = list(tensor.shape)
+        if shape and int(np.prod(shape)) != data.size:
+            raise ValueError(f"Input '{tensor.name}' has {data.size} values but shape {shape}")
+        tensors.append({"name": tensor.name, "shape": shape, "data": data.reshape(shape) if shape else data})
+    return tensors
+
+
+class InferenceServicer(pb_grpc.GRPCInferenceServiceServicer):
+    def __init__(self, run_inference: Callable[[np.ndarray, str], Awaitable[Tuple[np.ndarray, str]]],
+                 parse_inputs: Callable[[list], np.ndarray], model_metadata: Callable[[str], Awaitable[dict]],
+                 get_model: Callable, server_ready: Callable[[], bool]):
+        self.run_inference = run_inference
+        self.parse_inputs = parse_inputs
+        self.model_metadata = model_metadata
+        self.get_model = get_model
+        self.server_ready = server_ready
+
+    async def ServerLive(self, request, context):
+        return pb.ServerLiveResponse(live=True)
+
+    async def ServerReady(self, request, context):
+        return pb.ServerReadyResponse(ready=self.server_ready())
+
+    async def ServerMetadata(self, request, context):
+        return pb.ServerMetadataResponse(name="fastapi-serve", version="2", extensions=["model_repository"])
+
+    async def ModelReady(self, request, context):
+        try:
+            store = await self.get_model(request.name)
+        except ModelNotFound as e:
+            await context.abort(grpc.StatusCode.NOT_FOUND, str(e))
+        return pb.ModelReadyResponse(ready=store.ready)
+
+    async def ModelMetadata(self, request, context):
+        try:
+            metadata = await self.model_metadata(request.name)
+        except ModelNotFound as e:
+            await context.abort(grpc.StatusCode.NOT_FOUND, str(e))
+        tensor = pb.ModelMetadataResponse.TensorMetadata
+        return pb.ModelMetadataResponse(
+            name=metadata["name"], versions=metadata["versions"], platform=metadata["platform"],
+            inputs=[tensor(**spec) for spec in metadata["inputs"]],
+            outputs=[tensor(**spec) for spec in metadata["outputs"]],
+        )
+
+    async def ModelInfer(self, request, context):
+        route = f"/{SERVICE}/ModelInfer"
+        start = time.perf_counter()
+        status = grpc.StatusCode.OK
+        try:
+            with metrics.observe_phase(route, "parse"):
+                features = self.parse_inputs(decode_inputs(request))
+            with metrics.observe_phase(route, "predict"):
+                prediction, model_version = await self.run_inference(features, request.model_name)
+            with metrics.observe_phase(route, "serialize"):
+                raw = np.ascontiguousarray(prediction, dtype=V2_DATATYPES["FP32"]).tobytes()
+                return pb.ModelInferResponse(
+                    model_name=request.model_name,
+                    model_version=model_version,
+                    id=request.id,
+                    outputs=[pb.ModelInferResponse.InferOutputTensor(
+                        name="prediction", datatype="FP32", shape=[len(prediction)])],
+                    raw_output_contents=[raw],
+                )
+        except Exception as e:
+            status, message = self._status_for(e)
+            metrics.ERRORS.labels(route, type(e).__name__).inc()
+            await context.abort(status, message)
+        finally:
+            metrics.REQUEST_LATENCY.labels(route, "grpc", status.name).observe(time.perf_counter() - start)
+
+    @staticmethod
+    def _status_for(error: Exception):
+        if isinstance(error, (ValueError, KeyError)):
+            return grpc.StatusCode.INVALID_ARGUMENT, str(error)
+        if isinstance(error, ModelNotFound):
+            return grpc.StatusCode.NOT_FOUND, str(error)
+        if isinstance(error, Overloaded):
+            return grpc.StatusCode.RESOURCE_EXHAUSTED, str(error)
+        if isinstance(error, ModelNotReady):
+            return grpc.StatusCode.UNAVAILABLE, str(error)
+        logger.exception("gRPC ModelInfer failed")
+        return grpc.StatusCode.INTERNAL, str(error)
+
+
+async def start_grpc_server(servicer: InferenceServicer, port: int, max_message_bytes: int) -> grpc.aio.Server:
+    """Start the gRPC server on the running event loop; the caller stops it on shutdown."""
+    server = grpc.aio.server(options=[
+        ("grpc.max_receive_message_length", max_message_bytes),
+        ("grpc.max_send_message_length", max_message_bytes),
+    ])
+    pb_grpc.add_GRPCInferenceServiceServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    logger.info(f"gRPC KServe v2 endpoint listening on port {port}")
+    return server
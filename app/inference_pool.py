@@ -0,0 +1,69 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+
+
+class Overloaded(Exception):
+    """Raised when the inference queue is full; the request should be shed with a 503."""
+
+
+class InferencePool:
+    """
+    Runs CPU-bound inference off the event loop with bounded concurrency.
+
+    At most ``max_concurrency`` calls run in the executor at once and at most
+    ``max_queue_depth`` callers may wait for a slot; anything beyond that fails fast with
+    ``Overloaded`` instead of letting latency pile up. With ``kind="process"`` the callable
+    and its arguments are pickled to worker processes, so pass the model snapshot explicitly.
+    """
+
+    def __init__(self, workers: int, max_concurrency: int, max_queue_depth: int, kind: str = "thread"):
+        if kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        elif kind == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inference")
+        else:
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.kind = kind
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.queued = 0
+        self.running = 0
+        # Created on first use so it binds to the server's event loop, not the import-time one
+        self._semaphore = None
+
+    def check_capacity(self, queued_elsewhere: int = 0) -> None:
+        """Shed load if the callers already waiting, plus ``queued_elsewhere``, fill the queue."""
+        if self.queued + queued_elsewhere >= self.max_queue_depth:
+            raise Overloaded(f"Inference queue is full ({self.queued + queued_elsewhere} waiting)")
+
+    async def run(self, fn: Callable, *args, admit: bool = True):
+        """
+        Run ``fn(*args)`` in the executor once a concurrency slot is free.
+        ``admit=False`` skips the queue-depth check for work that was already admitted.
+        """
+        if admit:
+            self.check_capacity()
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        self.queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.running -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {"executor": self.kind, "running": self.running, "queued": self.queued,
+                "max_concurrency": self.max_concurrency, "max_queue_depth": self.max_queue_depth}
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
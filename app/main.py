@@ -1,13 +1,33 @@
+import asyncio
+import logging
+import time
 import numpy as np
 import boto3
-import joblib
-import tempfile
 import os
-from fastapi import FastAPI, Form, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Form, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
-from sklearn.preprocessing import StandardScaler
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.concurrency import run_in_threadpool
+import metrics
+from batching import MicroBatcher
+from grpc_server import InferenceServicer, start_grpc_server
+from inference_pool import InferencePool, Overloaded
+from model_registry import ModelNotFound, ModelRegistry
+from model_store import LocalObjectClient, ModelNotReady, ModelStore
+from prediction_cache import PredictionCache
+from schemas import FEATURE_NAMES, InferenceRequest, InferenceResponse, InvalidRequest, parse_inputs
+from streaming import SLOW_CONSUMER_CLOSE_CODE, StreamSession
+from tensor_codec import (ARROW_CONTENT_TYPE, NPY_CONTENT_TYPE, V2_HEADER_LENGTH, decode_arrow, decode_json,
+                          decode_npy, decode_v2_binary, encode_arrow, encode_json, encode_npy, encode_v2_binary,
+                          wants_v2_binary_output)
+
+# Process start, used to log how long a cold start takes until the model is ready
+STARTED_AT = time.perf_counter()
+
+logging.basicConfig(level=logging.INFO, format="[ %(asctime)s ] %(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger("app")
 
 # Initialize FastAPI app
 app = FastAPI()
@@ -17,46 +37,339 @@ S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME")
 MODEL_KEY = os.getenv("MODEL_S3_KEY", "models/model.pkl")
 AWS_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 
+# Serve model objects from a local directory instead of S3 (keys resolve relative to it)
+MODEL_LOCAL_DIR = os.getenv("MODEL_LOCAL_DIR")
+
+# Model registry: the default model is served from MODEL_KEY, any other name from the key template
+DEFAULT_MODEL_NAME = "fastapi-serve"
+MODEL_KEY_TEMPLATE = os.getenv("MODEL_S3_KEY_TEMPLATE", "models/{name}/model.pkl")
+MAX_RESIDENT_MODELS = int(os.getenv("MAX_RESIDENT_MODELS", "8"))
+MAX_RESIDENT_BYTES = int(os.getenv("MAX_RESIDENT_BYTES", "0"))
+
+# Dynamic micro-batching of concurrent requests (opt-in)
+BATCHING_ENABLED = os.getenv("BATCHING_ENABLED", "false").lower() == "true"
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "64"))
+MAX_BATCH_WAIT_US = int(os.getenv("MAX_BATCH_WAIT_US", "2000"))
+
+# "compiled" scores linear models with a NumPy matmul, "sklearn" always calls model.predict
+PREDICTOR_MODE = os.getenv("PREDICTOR_MODE", "compiled")
+
+# Seconds between checks of the model object's ETag; 0 disables hot reload
+MODEL_RELOAD_INTERVAL_S = float(os.getenv("MODEL_RELOAD_INTERVAL_S", "60"))
+
+# Local directory that keeps the downloaded artifact keyed by ETag (unset disables the cache)
+MODEL_CACHE_DIR = os.getenv("MODEL_CACHE_DIR")
+
+# Load models from the cache file with joblib's mmap_mode, so worker processes share their arrays
+MODEL_MMAP = os.getenv("MODEL_MMAP", "false").lower() == "true"
+
+# In-process LRU+TTL cache of row predictions (size 0 disables it)
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "0"))
+PREDICTION_CACHE_TTL_S = float(os.getenv("PREDICTION_CACHE_TTL_S", "60"))
+
+# Inference runs in a "thread" or "process" pool; requests beyond the queue depth get a 503
+INFERENCE_EXECUTOR = os.getenv("INFERENCE_EXECUTOR", "thread")
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", str(os.cpu_count() or 1)))
+MAX_CONCURRENT_INFERENCES = int(os.getenv("MAX_CONCURRENT_INFERENCES", str(INFERENCE_WORKERS)))
+MAX_QUEUE_DEPTH = int(os.getenv("MAX_QUEUE_DEPTH", "64"))
+
+# KServe v2 gRPC endpoint next to the REST routes (opt-in)
+GRPC_ENABLED = os.getenv("GRPC_ENABLED", "false").lower() == "true"
+GRPC_PORT = int(os.getenv("GRPC_PORT", "8081"))
+GRPC_MAX_MESSAGE_BYTES = int(os.getenv("GRPC_MAX_MESSAGE_BYTES", str(64 * 1024 * 1024)))
+
+# WebSocket prediction streams: messages queued per connection before reading pauses, how rows
+# arriving close together are batched, and how long a consumer may leave a reply unread
+STREAM_MAX_PENDING = int(os.getenv("STREAM_MAX_PENDING", "256"))
+STREAM_MAX_BATCH_ROWS = int(os.getenv("STREAM_MAX_BATCH_ROWS", str(MAX_BATCH_SIZE)))
+STREAM_MAX_WAIT_US = int(os.getenv("STREAM_MAX_WAIT_US", str(MAX_BATCH_WAIT_US)))
+STREAM_SEND_TIMEOUT_S = float(os.getenv("STREAM_SEND_TIMEOUT_S", "10"))
+
 # Validate required environment variables
-if not S3_BUCKET_NAME:
+if not S3_BUCKET_NAME and not MODEL_LOCAL_DIR:
     raise ValueError("S3_BUCKET_NAME environment variable is required")
 
-# Initialize S3 client (will automatically use environment variables)
-s3_client = boto3.client('s3', region_name=AWS_REGION)
 
-# Function to load model from S3
-def load_model_from_s3():
-    try:
-        # Create a temporary file to store the downloaded model
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pkl') as temp_file:
-            # Download model from S3
-            s3_client.download_file(S3_BUCKET_NAME, MODEL_KEY, temp_file.name)
-            # Load the model using joblib
-            model = joblib.load(temp_file.name)
-            # Clean up temporary file
-            os.unlink(temp_file.name)
-            return model
-    except Exception as e:
-        print(f"Error loading model from S3: {e}")
-        raise
+def make_s3_client():
+    """Initialize S3 client (will automatically use environment variables)"""
+    if MODEL_LOCAL_DIR:
+        return LocalObjectClient(MODEL_LOCAL_DIR)
+    return boto3.client('s3', region_name=AWS_REGION)
 
-# Load model from S3
-model = load_model_from_s3()
 
-# model = joblib.load("model.pkl")
+s3_client = make_s3_client()
+
+
+def make_model_store(name: str) -> ModelStore:
+    """Model holder for ``name``: loads it from S3 and hot-swaps it when a new version is uploaded."""
+    key = MODEL_KEY if name == DEFAULT_MODEL_NAME else MODEL_KEY_TEMPLATE.format(name=name)
+    return ModelStore(
+        s3_client, S3_BUCKET_NAME, key, PREDICTOR_MODE,
+        cache_dir=os.path.join(MODEL_CACHE_DIR, name) if MODEL_CACHE_DIR else None,
+        on_swap=lambda loaded, previous: metrics.record_model_swap(name, loaded, previous),
+        name=name,
+        mmap_mode="r" if MODEL_MMAP else None,
+    )
+
+
+# Batchers of evicted models still draining; held here so their stop tasks are not garbage-collected
+stopping_batchers = set()
+
 
-# Preprocessor
-sclr = StandardScaler()
+def _batcher_stopped(task: asyncio.Task) -> None:
+    stopping_batchers.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Stopping an evicted model's batcher failed: {task.exception()!r}")
+
+
+def forget_model(name: str, store: ModelStore) -> None:
+    """Release everything held for an evicted model."""
+    batcher = batchers.pop(name, None)
+    if batcher is not None:
+        task = asyncio.create_task(batcher.stop())
+        stopping_batchers.add(task)
+        task.add_done_callback(_batcher_stopped)
+    if prediction_cache is not None:
+        prediction_cache.forget(name)
+    if store.current is not None:
+        metrics.forget_model(name, store.current.version)
+
+
+registry = ModelRegistry(make_model_store, MAX_RESIDENT_MODELS, MAX_RESIDENT_BYTES, on_evict=forget_model)
+
+# The default model is loaded in a startup task and never evicted
+model_store = make_model_store(DEFAULT_MODEL_NAME)
+registry.add(DEFAULT_MODEL_NAME, model_store, pinned=True)
+
+
+def reinit_after_fork() -> None:
+    """
+    Give a forked worker its own S3 client. The parent's client holds pooled connections
+    that must not be shared across processes; the loaded models themselves are kept.
+    """
+    global s3_client
+    s3_client = make_s3_client()
+    for _, store in registry.items():
+        store.s3_client = s3_client
+
+# model = joblib.load("model.pkl")
 
 # Set up Jinja2 templates directory
 import os
 template_dir = "templates" if os.path.exists("templates") else "../templates"
 templates = Jinja2Templates(directory=template_dir)
 
+
+async def read_body(request: Request) -> dict:
+    """
+    Decode a request body into the JSON request layout.
+
+    KServe v2 binary requests keep their JSON header with binary inputs as NumPy arrays;
+    ``.npy`` and Arrow IPC bodies become ``{"inputs": <[N, 8] array>}``.
+    Bodies that cannot be decoded raise ``InvalidRequest``.
+    """
+    header_length = request.headers.get(V2_HEADER_LENGTH)
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    body = await request.body()
+    try:
+        if header_length is not None:
+            return decode_v2_binary(body, int(header_length))
+        if content_type == NPY_CONTENT_TYPE:
+            return {"inputs": decode_npy(body)}
+        if content_type == ARROW_CONTENT_TYPE:
+            return {"inputs": decode_arrow(body, FEATURE_NAMES)}
+        decoded = decode_json(body)
+    except ValueError as e:
+        raise InvalidRequest(f"Could not decode request body: {e}") from e
+    if not isinstance(decoded, dict):
+        raise InvalidRequest("Request body must be a JSON object")
+    return decoded
+
+
+def encode_response(request: Request, body: dict, payload: dict, prediction: np.ndarray):
+    """
+    Return ``payload`` as JSON, or in the binary form the client asked for.
+    Output ``data`` stays a NumPy array throughout; orjson writes it without a ``tolist()`` round trip.
+    """
+    accept = request.headers.get("accept", "")
+    version_header = {"X-Model-Version": payload["model_version"]}
+    if NPY_CONTENT_TYPE in accept:
+        return Response(encode_npy(prediction), media_type=NPY_CONTENT_TYPE, headers=version_header)
+    if ARROW_CONTENT_TYPE in accept:
+        return Response(encode_arrow({"prediction": prediction}), media_type=ARROW_CONTENT_TYPE,
+                        headers=version_header)
+    if wants_v2_binary_output(body):
+        content, header_length = encode_v2_binary(payload, {"prediction": prediction})
+        return Response(content, media_type="application/octet-stream",
+                        headers={"Inference-Header-Content-Length": str(header_length), **version_header})
+
+    return Response(encode_json(payload), media_type="application/json", headers=version_header)
+
+
+inference_pool = InferencePool(INFERENCE_WORKERS, MAX_CONCURRENT_INFERENCES, MAX_QUEUE_DEPTH, INFERENCE_EXECUTOR)
+
+
+async def predict_batch(store: ModelStore, features: np.ndarray, admit: bool = True):
+    """
+    Score an ``[N, 8]`` feature matrix with a single vectorized predict call in the inference pool.
+
+    The model artifact is a scaler + regressor pipeline, so raw features go in as-is.
+    Returns the predictions and the version of the model snapshot that produced them.
+    """
+    loaded = store.current
+    if loaded is None:
+        raise ModelNotReady("Model is not loaded yet")
+    predictions = await inference_pool.run(loaded.predictor.predict, features, admit=admit)
+    metrics.BATCH_SIZE.observe(len(features))
+    return predictions, loaded.version
+
+
+# One micro-batcher per model, created on first use when batching is enabled
+batchers = {}
+prediction_cache = PredictionCache(PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL_S) if PREDICTION_CACHE_SIZE > 0 else None
+model_task = None
+grpc_server = None
+
+metrics.INFERENCE_RUNNING.set_function(lambda: inference_pool.running)
+metrics.INFERENCE_QUEUED.set_function(lambda: inference_pool.queued)
+metrics.BATCH_PENDING.set_function(lambda: sum(batcher.pending for batcher in batchers.values()))
+metrics.CACHE_HITS.set_function(lambda: prediction_cache.hits if prediction_cache is not None else 0)
+metrics.CACHE_MISSES.set_function(lambda: prediction_cache.misses if prediction_cache is not None else 0)
+metrics.RESIDENT_MODELS.set_function(lambda: len(registry.stats()["resident"]))
+metrics.RESIDENT_MODEL_BYTES.set_function(lambda: registry.resident_bytes)
+
+
+def get_batcher(name: str, store: ModelStore) -> MicroBatcher:
+    batcher = batchers.get(name)
+    if batcher is None:
+        # Requests were admitted before joining the batch queue, so a formed batch is never shed
+        batcher = MicroBatcher(lambda features: predict_batch(store, features, admit=False),
+                               MAX_BATCH_SIZE, MAX_BATCH_WAIT_US)
+        batcher.start()
+        batchers[name] = batcher
+    return batcher
+
+
+async def score(name: str, store: ModelStore, features: np.ndarray):
+    """Score ``features`` directly, or through the model's micro-batcher when batching is enabled."""
+    if BATCHING_ENABLED:
+        batcher = get_batcher(name, store)
+        # Rows waiting in the batcher count toward the queue as the batches they will become
+        inference_pool.check_capacity(batcher.pending_batches)
+        return await batcher.submit(features)
+    return await predict_batch(store, features)
+
+
+async def run_inference(features: np.ndarray, model_name: str = DEFAULT_MODEL_NAME):
+    """
+    Score ``features`` with the named model, loading it on demand.
+    Cached rows come from the prediction cache and only the misses go to the model.
+    """
+    store = await registry.get(model_name)
+    loaded = store.current
+    if prediction_cache is None or loaded is None:
+        return await score(model_name, store, features)
+
+    predictions, miss_mask = prediction_cache.lookup(model_name, loaded.version, features)
+    if not miss_mask.any():
+        return predictions, loaded.version
+
+    scored, model_version = await score(model_name, store, features[miss_mask])
+    if model_version != loaded.version:
+        # The model was swapped while scoring; don't mix versions in one response
+        predictions, model_version = await score(model_name, store, features)
+        prediction_cache.store(model_name, model_version, features, predictions)
+        return predictions, model_version
+
+    predictions[miss_mask] = scored
+    prediction_cache.store(model_name, model_version, features[miss_mask], scored)
+    return predictions, model_version
+
+
+async def manage_model():
+    """Load the model without blocking startup, log the cold-start cost, then poll for new versions."""
+    await model_store.load_until_ready()
+    logger.info(f"Model ready {time.perf_counter() - STARTED_AT:.2f}s after process start")
+    if MODEL_RELOAD_INTERVAL_S > 0:
+        await registry.poll(MODEL_RELOAD_INTERVAL_S)
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    global model_task, grpc_server
+    model_task = asyncio.create_task(manage_model())
+    if GRPC_ENABLED:
+        servicer = InferenceServicer(run_inference, parse_inputs, model_metadata, registry.get,
+                                     server_ready=lambda: model_store.ready)
+        grpc_server = await start_grpc_server(servicer, GRPC_PORT, GRPC_MAX_MESSAGE_BYTES)
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    if grpc_server is not None:
+        await grpc_server.stop(grace=5)
+    for batcher in batchers.values():
+        await batcher.stop()
+    await asyncio.gather(*stopping_batchers, return_exceptions=True)
+    if model_task is not None:
+        model_task.cancel()
+    inference_pool.shutdown()
+
+
+def route_label(request: Request) -> str:
+    """Route template of the request, so metric labels don't grow with every model name."""
+    route = request.scope.get("route")
+    return route.path if route is not None else "unmatched"
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    metrics.REQUEST_LATENCY.labels(
+        route_label(request), request.method, str(response.status_code)
+    ).observe(time.perf_counter() - start)
+    return response
+
+
+# Errors answered by their own handler below; anything else is a 500
+CLIENT_ERRORS = (InvalidRequest, ValidationError, ModelNotFound, ModelNotReady, Overloaded)
+
+
+@app.exception_handler(InvalidRequest)
+async def invalid_request_handler(request: Request, exc: InvalidRequest):
+    metrics.ERRORS.labels(route_label(request), "InvalidRequest").inc()
+    return JSONResponse(status_code=400, content={"error": str(exc)})
+
+
+@app.exception_handler(ValidationError)
+async def validation_error_handler(request: Request, exc: ValidationError):
+    metrics.ERRORS.labels(route_label(request), "ValidationError").inc()
+    details = exc.errors(include_url=False, include_context=False, include_input=False)
+    return JSONResponse(status_code=422, content={"error": "Invalid request", "detail": details})
+
+
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request: Request, exc: Overloaded):
+    metrics.ERRORS.labels(route_label(request), "Overloaded").inc()
+    return JSONResponse(status_code=503, content={"error": str(exc)}, headers={"Retry-After": "1"})
+
+
+@app.exception_handler(ModelNotReady)
+async def model_not_ready_handler(request: Request, exc: ModelNotReady):
+    metrics.ERRORS.labels(route_label(request), "ModelNotReady").inc()
+    return JSONResponse(status_code=503, content={"error": str(exc)}, headers={"Retry-After": "1"})
+
+
+@app.exception_handler(ModelNotFound)
+async def model_not_found_handler(request: Request, exc: ModelNotFound):
+    metrics.ERRORS.labels(route_label(request), "ModelNotFound").inc()
+    return JSONResponse(status_code=404, content={"error": str(exc)})
+
 # Root GET endpoint
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return await run_in_threadpool(templates.TemplateResponse, request, "index.html", {})
 
 # POST prediction endpoint
 @app.post("/predict", response_class=HTMLResponse)
@@ -73,117 +386,155 @@ async def predict(
 ):
     # Combine features
     features = np.array([[Open, High, Low, Adj_Close, Volume, year, month, day]])
-    features = sclr.fit_transform(features)  # Ideally use same scaler as training
-    prediction = model.predict(features)
+    with metrics.observe_phase("/predict", "predict"):
+        prediction, _ = await run_inference(features)
     
-    return templates.TemplateResponse("index.html", {
-        "request": request,
+    return await run_in_threadpool(templates.TemplateResponse, request, "index.html", {
         "output": prediction[0]
     })
 
 # Optional: Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "model_loaded": model is not None}
+    """Readiness: 503 until the model is loaded so no traffic is routed to a cold pod."""
+    loaded = model_store.current
+    if loaded is None:
+        return JSONResponse(status_code=503, content={"status": "loading", "model_loaded": False})
+    return {
+        "status": "healthy",
+        "model_loaded": loaded is not None,
+        "model_version": loaded.version,
+        "predictor": loaded.predictor.mode,
+        "prediction_cache": prediction_cache.stats() if prediction_cache is not None else None,
+        "inference": {**inference_pool.stats(),
+                      "batch_pending": sum(batcher.pending for batcher in batchers.values())},
+        "models": registry.stats()
+    }
+
+# Prometheus scrape endpoint
+@app.get("/metrics")
+async def prometheus_metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+# Liveness: the process is up, whether or not the model has finished loading
+@app.get("/live")
+async def liveness_check():
+    return {"status": "alive"}
 
 # KServe compatible endpoints
-@app.get("/v1/models/fastapi-serve")
-async def model_metadata():
+@app.get("/v1/models/{model_name}")
+async def model_metadata(model_name: str):
+    store = await registry.get(model_name)
     return {
-        "name": "fastapi-serve",
-        "versions": ["v1"],
+        "name": model_name,
+        "versions": [store.current.version] if store.ready else [],
         "platform": "sklearn",
         "inputs": [
-            {"name": "Open", "datatype": "FP32", "shape": [1]},
-            {"name": "High", "datatype": "FP32", "shape": [1]},
-            {"name": "Low", "datatype": "FP32", "shape": [1]},
-            {"name": "Adj_Close", "datatype": "FP32", "shape": [1]},
-            {"name": "Volume", "datatype": "FP32", "shape": [1]},
-            {"name": "year", "datatype": "INT32", "shape": [1]},
-            {"name": "month", "datatype": "INT32", "shape": [1]},
-            {"name": "day", "datatype": "INT32", "shape": [1]}
+            {"name": "Open", "datatype": "FP32", "shape": [-1]},
+            {"name": "High", "datatype": "FP32", "shape": [-1]},
+            {"name": "Low", "datatype": "FP32", "shape": [-1]},
+            {"name": "Adj_Close", "datatype": "FP32", "shape": [-1]},
+            {"name": "Volume", "datatype": "FP32", "shape": [-1]},
+            {"name": "year", "datatype": "INT32", "shape": [-1]},
+            {"name": "month", "datatype": "INT32", "shape": [-1]},
+            {"name": "day", "datatype": "INT32", "shape": [-1]}
         ],
         "outputs": [
-            {"name": "prediction", "datatype": "FP32", "shape": [1]}
+            {"name": "prediction", "datatype": "FP32", "shape": [-1]}
         ]
     }
 
-@app.post("/v1/models/fastapi-serve:predict")
-async def kserve_predict(request: Request):
+@app.post("/v1/models/{model_name}:predict", response_model=InferenceResponse)
+async def kserve_predict(model_name: str, request: Request):
     """KServe compatible prediction endpoint"""
+    route = "/v1/models/{model_name}:predict"
     try:
-        body = await request.json()
-        inputs = body.get("inputs", [])
-        
-        if len(inputs) != 8:
-            return {"error": "Expected 8 input values"}
-        
-        # Extract values assuming they're in the correct order
-        features = np.array([inputs])
-        features = sclr.fit_transform(features)
-        prediction = model.predict(features)
-        
-        return {
-            "model_name": "fastapi-serve",
-            "model_version": "v1",
+        with metrics.observe_phase(route, "parse"):
+            body = await read_body(request)
+            inference_request = InferenceRequest.model_validate(body)
+        with metrics.observe_phase(route, "predict"):
+            prediction, model_version = await run_inference(inference_request.features, model_name)
+
+        payload = {
+            "model_name": model_name,
+            "model_version": model_version,
             "outputs": [
                 {
                     "name": "prediction",
                     "datatype": "FP32",
-                    "shape": [1],
-                    "data": [float(prediction[0])]
+                    "shape": [len(prediction)],
+                    "data": prediction
                 }
             ]
         }
+        with metrics.observe_phase(route, "serialize"):
+            return encode_response(request, body, payload, prediction)
+    except CLIENT_ERRORS:
+        raise
     except Exception as e:
-        return {"error": str(e)}
+        logger.exception(f"Prediction failed for {model_name}")
+        metrics.ERRORS.labels(route, type(e).__name__).inc()
+        return JSONResponse(status_code=500, content={"error": str(e)})
 
 # Alternative KServe prediction endpoint with better input handling
-@app.post("/v1/models/fastapi-serve/infer")
-async def kserve_infer(request: Request):
+@app.post("/v1/models/{model_name}/infer", response_model=InferenceResponse)
+async def kserve_infer(model_name: str, request: Request):
     """Alternative KServe inference endpoint"""
+    route = "/v1/models/{model_name}/infer"
     try:
-        body = await request.json()
-        
-        # Handle both array input and named inputs
-        if "inputs" in body:
-            if isinstance(body["inputs"], list) and len(body["inputs"]) == 8:
-                inputs = body["inputs"]
-            elif isinstance(body["inputs"], dict):
-                # Extract from named inputs
-                inputs = [
-                    body["inputs"].get("Open", 0),
-                    body["inputs"].get("High", 0),
-                    body["inputs"].get("Low", 0),
-                    body["inputs"].get("Adj_Close", 0),
-                    body["inputs"].get("Volume", 0),
-                    body["inputs"].get("year", 2024),
-                    body["inputs"].get("month", 1),
-                    body["inputs"].get("day", 1)
-                ]
-            else:
-                return {"error": "Invalid input format"}
-        else:
-            return {"error": "Missing 'inputs' field"}
-        
-        features = np.array([inputs])
-        features = sclr.fit_transform(features)
-        prediction = model.predict(features)
-        
-        return {
-            "model_name": "fastapi-serve",
-            "model_version": "v1",
-            "id": "prediction-001",
+        with metrics.observe_phase(route, "parse"):
+            body = await read_body(request)
+            inference_request = InferenceRequest.model_validate(body)
+        with metrics.observe_phase(route, "predict"):
+            prediction, model_version = await run_inference(inference_request.features, model_name)
+
+        payload = {
+            "model_name": model_name,
+            "model_version": model_version,
+            "id": inference_request.id or "prediction-001",
             "outputs": [
                 {
                     "name": "prediction",
                     "datatype": "FP32",
-                    "shape": [1],
-                    "data": [float(prediction[0])]
+                    "shape": [len(prediction)],
+                    "data": prediction
                 }
             ]
         }
+        with metrics.observe_phase(route, "serialize"):
+            return encode_response(request, body, payload, prediction)
+    except CLIENT_ERRORS:
+        raise
     except Exception as e:
-        return {"error": str(e), "status": "failed"}
+        logger.exception(f"Inference failed for {model_name}")
+        metrics.ERRORS.labels(route, type(e).__name__).inc()
+        return JSONResponse(status_code=500, content={"error": str(e), "status": "failed"})
 
+# Streaming predictions over one WebSocket session, for continuous tick feeds
+@app.websocket("/v1/models/{model_name}/stream")
+async def kserve_stream(websocket: WebSocket, model_name: str):
+    try:
+        await registry.get(model_name)
+    except ModelNotFound as e:
+        await websocket.close(code=1008, reason=str(e))
+        return
 
+    await websocket.accept()
+    session = StreamSession(websocket, lambda features: run_inference(features, model_name), STREAM_MAX_PENDING,
+                            STREAM_MAX_BATCH_ROWS, STREAM_MAX_WAIT_US, STREAM_SEND_TIMEOUT_S)
+    metrics.STREAM_CONNECTIONS.inc()
+    close_code = 1000
+    try:
+        if not await session.run():
+            close_code = SLOW_CONSUMER_CLOSE_CODE
+            metrics.ERRORS.labels("/v1/models/{model_name}/stream", "SlowConsumer").inc()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        metrics.STREAM_CONNECTIONS.dec()
+        metrics.STREAM_MESSAGES.inc(session.messages)
+        try:
+            await asyncio.wait_for(websocket.close(code=close_code), 1.0)
+        except Exception:
+            # Already closed by the client
+            pass
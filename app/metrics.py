@@ -0,0 +1,62 @@
+"""Prometheus metrics for the serving app, exposed on ``/metrics``."""
+import time
+from contextlib import contextmanager
+
+from prometheus_client import Counter, Gauge, Histogram
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384)
+
+REQUEST_LATENCY = Histogram(
+    "request_latency_seconds", "End-to-end request latency per route",
+    ["route", "method", "status"], buckets=LATENCY_BUCKETS,
+)
+PHASE_LATENCY = Histogram(
+    "request_phase_seconds", "Time spent per request phase (parse, predict, serialize)",
+    ["route", "phase"], buckets=LATENCY_BUCKETS,
+)
+BATCH_SIZE = Histogram("predict_batch_size", "Rows per model predict call", buckets=BATCH_BUCKETS)
+ERRORS = Counter("request_errors_total", "Failed requests by route and error type", ["route", "error_type"])
+
+MODEL_LOAD_SECONDS = Histogram(
+    "model_load_seconds", "Model load duration by kind (initial, reload) and phase",
+    ["kind", "phase"], buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+MODEL_INFO = Gauge("model_info", "Currently served version of each resident model (value is always 1)",
+                   ["model", "version"])
+RESIDENT_MODELS = Gauge("resident_models", "Models currently loaded in the registry")
+RESIDENT_MODEL_BYTES = Gauge("resident_model_bytes", "Artifact bytes of the models currently loaded")
+
+INFERENCE_RUNNING = Gauge("inference_running", "Predict calls currently executing")
+INFERENCE_QUEUED = Gauge("inference_queued", "Predict calls waiting for a concurrency slot")
+BATCH_PENDING = Gauge("batch_pending_requests", "Requests waiting to be grouped into a batch")
+CACHE_HITS = Gauge("prediction_cache_hits", "Prediction cache row hits since start")
+CACHE_MISSES = Gauge("prediction_cache_misses", "Prediction cache row misses since start")
+STREAM_CONNECTIONS = Gauge("stream_connections", "Open WebSocket prediction streams")
+STREAM_MESSAGES = Counter("stream_messages_total", "Replies sent on WebSocket prediction streams")
+
+
+@contextmanager
+def observe_phase(route: str, phase: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASE_LATENCY.labels(route, phase).observe(time.perf_counter() - start)
+
+
+def forget_model(model_name: str, version) -> None:
+    try:
+        MODEL_INFO.remove(model_name, version)
+    except KeyError:
+        pass
+
+
+def record_model_swap(model_name: str, loaded, previous_version) -> None:
+    """Record load timings of a newly swapped-in model and publish its version."""
+    kind = "initial" if previous_version is None else "reload"
+    for phase, seconds in loaded.timings.items():
+        MODEL_LOAD_SECONDS.labels(kind, phase).observe(seconds)
+    if previous_version is not None:
+        forget_model(model_name, previous_version)
+    MODEL_INFO.labels(model_name, loaded.version).set(1)
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import re
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Set
+
+from model_store import ModelStore
+
+logger = logging.getLogger(__name__)
+
+# Model names end up in object keys and cache paths, so keep them to a safe alphabet
+MODEL_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+class ModelNotFound(Exception):
+    """Raised when a requested model has no artifact in the model store."""
+
+
+class ModelRegistry:
+    """
+    Serves many models from one process, loading them on demand.
+
+    At most ``max_models`` models (and ``max_bytes`` of artifacts, if set) stay resident;
+    beyond that the least recently used unpinned model is evicted. Concurrent first requests
+    for the same model share one load.
+    """
+
+    def __init__(self, store_factory: Callable[[str], ModelStore], max_models: int = 8, max_bytes: int = 0,
+                 on_evict: Optional[Callable[[str, ModelStore], None]] = None):
+        self.store_factory = store_factory
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self._stores: "OrderedDict[str, ModelStore]" = OrderedDict()
+        self._pinned: Set[str] = set()
+        self._loading: Dict[str, asyncio.Task] = {}
+
+    def add(self, name: str, store: ModelStore, pinned: bool = False) -> None:
+        """Register an already constructed store, e.g. the default model loaded at startup."""
+        self._stores[name] = store
+        if pinned:
+            self._pinned.add(name)
+
+    def items(self):
+        return list(self._stores.items())
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(store.current.size_bytes for store in self._stores.values() if store.ready)
+
+    async def get(self, name: str) -> ModelStore:
+        """Return the store for ``name``, loading it first if it is not resident."""
+        store = self._stores.get(name)
+        if store is not None:
+            self._stores.move_to_end(name)
+            return store
+
+        if not MODEL_NAME_PATTERN.match(name):
+            raise ModelNotFound(f"Invalid model name: {name}")
+
+        task = self._loading.get(name)
+        if task is None:
+            task = asyncio.create_task(self._load(name))
+            self._loading[name] = task
+            task.add_done_callback(lambda _: self._loading.pop(name, None))
+        # shield: one caller giving up must not cancel the load the others are waiting on
+        return await asyncio.shield(task)
+
+    async def _load(self, name: str) -> ModelStore:
+        store = self.store_factory(name)
+        try:
+            await asyncio.to_thread(store.refresh)
+        except (FileNotFoundError, KeyError) as e:
+            raise ModelNotFound(f"Model '{name}' not found") from e
+        except Exception as e:
+            # botocore ClientError carries the S3 status in e.response
+            response = getattr(e, "response", None)
+            if isinstance(response, dict) and response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                raise ModelNotFound(f"Model '{name}' not found") from e
+            raise
+
+        self._stores[name] = store
+        self._evict(keep=name)
+        return store
+
+    def _over_limit(self) -> bool:
+        if len(self._stores) > self.max_models:
+            return True
+        return bool(self.max_bytes) and self.resident_bytes > self.max_bytes
+
+    def _evict(self, keep: str) -> None:
+        while self._over_limit():
+            victim = next((name for name in self._stores if name != keep and name not in self._pinned), None)
+            if victim is None:
+                break
+            store = self._stores.pop(victim)
+            logger.info(f"Evicted model {victim} ({self.resident_bytes} bytes still resident)")
+            if self.on_evict is not None:
+                self.on_evict(victim, store)
+
+    async def poll(self, interval: float) -> None:
+        """Check every resident model for a new version every ``interval`` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            for name, store in self.items():
+                try:
+                    await asyncio.to_thread(store.refresh)
+                except Exception as e:
+                    # Keep serving the current model; the next poll retries
+                    logger.warning(f"Model refresh failed for {name}: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "resident": [name for name, store in self._stores.items() if store.ready],
+            "resident_bytes": self.resident_bytes,
+            "max_models": self.max_models,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,206 @@
+import asyncio
+import io
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+
+from predictor import make_predictor
+
+logger = logging.getLogger(__name__)
+
+
+class ModelNotReady(RuntimeError):
+    """Raised when a model is asked to predict before its first version has loaded."""
+
+
+class LocalObjectClient:
+    """
+    Stand-in for the S3 client that serves model objects from a local directory.
+
+    Implements the two calls ``ModelStore`` needs. The ETag is derived from the file's
+    mtime and size, so replacing a file is picked up by hot reload like a new S3 upload.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        stat = os.stat(self._path(Key))
+        return {"ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"', "ContentLength": stat.st_size}
+
+    def get_object(self, Bucket: str, Key: str, IfMatch: Optional[str] = None) -> dict:
+        if IfMatch is not None and self.head_object(Bucket, Key)["ETag"] != IfMatch:
+            raise ValueError(f"Precondition failed: {Key} changed since it was checked")
+        with open(self._path(Key), "rb") as f:
+            return {"Body": io.BytesIO(f.read())}
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """An immutable, fully warmed model snapshot. Requests read one and use it throughout."""
+    model: Any
+    predictor: Any
+    version: str
+    loaded_at: float
+    timings: Dict[str, float]
+    size_bytes: int
+
+
+class ModelStore:
+    """
+    Holds the serving model and hot-reloads it from S3 when the object's ETag changes.
+
+    Models are read into memory rather than through a temp file. With ``cache_dir`` set,
+    the raw artifact is also kept on disk under its ETag, so a restarted container whose
+    cache volume survived skips the download. With ``mmap_mode`` set as well, the model is
+    loaded from that file with ``joblib.load(mmap_mode=...)``: its NumPy arrays stay backed
+    by the page cache, so every worker process serving the same version shares one copy.
+
+    New versions are fetched, unpickled and warmed with a test prediction off the request
+    path; only then is ``current`` swapped. Rebinding a single attribute is atomic, so
+    in-flight requests keep the snapshot they started with and never see a half-loaded model.
+    """
+
+    def __init__(self, s3_client, bucket: str, key: str, predictor_mode: str = "compiled",
+                 n_features: int = 8, cache_dir: Optional[str] = None,
+                 on_swap: Optional[Callable[[LoadedModel, Optional[str]], None]] = None,
+                 name: str = "model", mmap_mode: Optional[str] = None):
+        if mmap_mode and not cache_dir:
+            logger.warning(f"Memory-mapped loading of {name} needs a cache directory; loading into memory")
+            mmap_mode = None
+        self.name = name
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.predictor_mode = predictor_mode
+        self.n_features = n_features
+        self.cache_dir = cache_dir
+        self.on_swap = on_swap
+        self.mmap_mode = mmap_mode
+        self.current: Optional[LoadedModel] = None
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.current is not None
+
+    def remote_version(self) -> str:
+        """ETag of the model object in S3, without the surrounding quotes."""
+        head = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+        return head["ETag"].strip('"')
+
+    def _cache_path(self, version: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{version}.pkl")
+
+    def _write_cache(self, version: str, data: bytes) -> None:
+        """Atomically store ``data`` as the cached artifact and drop older versions."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(version)
+        # Per-process temp name: several workers may fetch the same version at once
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pkl") and name != os.path.basename(path):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def _read_artifact(self, version: str) -> Tuple[bytes, str]:
+        """Return the artifact bytes for ``version`` and where they came from."""
+        cache_path = self._cache_path(version)
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, "rb") as f:
+                return f.read(), "cache"
+        return self._download(version), "object store"
+
+    def _download(self, version: str) -> bytes:
+        """GET ``version`` from the object store, keeping a copy in the cache directory if set."""
+        cache_path = self._cache_path(version)
+        # IfMatch makes S3 reject the read if the object changed after the HEAD
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=self.key, IfMatch=f'"{version}"')
+        data = response["Body"].read()
+        if cache_path:
+            try:
+                self._write_cache(version, data)
+            except OSError as e:
+                logger.warning(f"Could not write model cache {cache_path}: {e}")
+        return data
+
+    def _fetch_and_unpickle(self, version: str, timings: Dict[str, float]) -> Tuple[Any, int, str]:
+        """Return the model object, its artifact size and where it came from; records both phases."""
+        mark = time.perf_counter()
+        cache_path = self._cache_path(version)
+        data, source = None, "cache"
+        if not self.mmap_mode:
+            data, source = self._read_artifact(version)
+        elif not os.path.exists(cache_path):
+            data, source = self._download(version), "object store"
+        timings["fetch"] = time.perf_counter() - mark
+
+        mark = time.perf_counter()
+        if self.mmap_mode and os.path.exists(cache_path):
+            model, size_bytes = joblib.load(cache_path, mmap_mode=self.mmap_mode), os.path.getsize(cache_path)
+        else:
+            # Also the fallback when the cache file could not be written
+            model, size_bytes = joblib.load(io.BytesIO(data)), len(data)
+        timings["unpickle"] = time.perf_counter() - mark
+        return model, size_bytes, source
+
+    def load(self, version: str) -> LoadedModel:
+        """Fetch ``version`` of the model (cache or S3), build its predictor and warm it up."""
+        timings = {}
+        start = time.perf_counter()
+        model, size_bytes, source = self._fetch_and_unpickle(version, timings)
+
+        mark = time.perf_counter()
+        predictor = make_predictor(model, self.predictor_mode)
+        warmup = predictor.predict(np.zeros((1, self.n_features)))
+        if warmup.shape != (1,) or not np.all(np.isfinite(warmup)):
+            raise ValueError(f"Warm-up prediction failed for model version {version}")
+        timings["warmup"] = time.perf_counter() - mark
+        timings["total"] = time.perf_counter() - start
+
+        logger.info(
+            f"Loaded model {self.name}@{version} ({size_bytes} bytes from {source}): "
+            + ", ".join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in timings.items())
+        )
+        return LoadedModel(model=model, predictor=predictor, version=version,
+                           loaded_at=time.time(), timings=timings, size_bytes=size_bytes)
+
+    def refresh(self) -> bool:
+        """Load and swap in the remote model if its version changed. Returns True on swap."""
+        with self._refresh_lock:
+            version = self.remote_version()
+            if self.current is not None and self.current.version == version:
+                return False
+
+            loaded = self.load(version)
+            previous = self.current.version if self.current is not None else None
+            self.current = loaded
+            logger.info(f"Swapped model {self.name}: {previous} -> {version}")
+            if self.on_swap is not None:
+                self.on_swap(loaded, previous)
+            return True
+
+    async def load_until_ready(self, max_backoff: float = 30.0) -> None:
+        """Load the first model off the event loop, retrying with backoff instead of crashing."""
+        delay = 1.0
+        while not self.ready:
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logger.warning(f"Initial model load failed, retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_backoff)
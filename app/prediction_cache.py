@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class PredictionCache:
+    """
+    Bounded LRU cache of single-row predictions with a per-entry TTL.
+
+    Keys are the model name, its version and the canonicalized 8-feature row, so a model swap
+    can never serve a stale prediction; a model's entries are also purged as soon as a new
+    version of it is seen.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_s: float = 60.0):
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str, bytes], Tuple[float, float]]" = OrderedDict()
+        self._versions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _row_keys(features: np.ndarray) -> List[bytes]:
+        # float64 + 0.0 folds -0.0 into 0.0 so equal rows always hash the same
+        canonical = np.ascontiguousarray(features, dtype=np.float64) + 0.0
+        return [row.tobytes() for row in canonical]
+
+    def _sync_version(self, model_name: str, version: str) -> None:
+        previous = self._versions.get(model_name)
+        if previous is not None and previous != version:
+            for key in [key for key in self._entries if key[0] == model_name]:
+                del self._entries[key]
+        self._versions[model_name] = version
+
+    def lookup(self, model_name: str, version: str, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(predictions, miss_mask)`` for ``features``.
+        ``predictions`` holds NaN wherever ``miss_mask`` is True.
+        """
+        predictions = np.full(len(features), np.nan)
+        miss_mask = np.ones(len(features), dtype=bool)
+        now = time.monotonic()
+
+        with self._lock:
+            self._sync_version(model_name, version)
+            for i, row_key in enumerate(self._row_keys(features)):
+                key = (model_name, version, row_key)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                value, expires_at = entry
+                if expires_at < now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                predictions[i] = value
+                miss_mask[i] = False
+
+            misses = int(miss_mask.sum())
+            self.misses += misses
+            self.hits += len(features) - misses
+        return predictions, miss_mask
+
+    def store(self, model_name: str, version: str, features: np.ndarray, predictions: np.ndarray) -> None:
+        expires_at = time.monotonic() + self.ttl_s
+        with self._lock:
+            self._sync_version(model_name, version)
+            for row_key, value in zip(self._row_keys(features), predictions):
+                key = (model_name, version, row_key)
+                self._entries[key] = (float(value), expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def forget(self, model_name: str) -> None:
+        """Drop every entry of ``model_name``, e.g. when it is evicted from the registry."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == model_name]:
+                del self._entries[key]
+            self._versions.pop(model_name, None)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries),
+                "max_size": self.max_size, "ttl_s": self.ttl_s}
@@ -0,0 +1,110 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SklearnPredictor:
+    """Generic path: defers to the estimator's own ``predict``."""
+
+    mode = "sklearn"
+
+    def __init__(self, model):
+        self.model = model
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        return np.asarray(self.model.predict(features), dtype=np.float64).ravel()
+
+
+class CompiledLinearPredictor:
+    """
+    NumPy-only scorer for linear models.
+
+    The scaler statistics are folded into the coefficients once at load time, so a batch is
+    scored with a single matmul and no sklearn input validation:
+    ``((x - mean) / scale) @ w + b == x @ (w / scale) + (b - (mean / scale) @ w)``.
+    """
+
+    mode = "compiled"
+
+    def __init__(self, coef: np.ndarray, intercept: float):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = float(intercept)
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        return np.asarray(features, dtype=np.float64) @ self.coef + self.intercept
+
+
+def _split_pipeline(model):
+    """Return ``(scaler, estimator)``; ``scaler`` is None for a bare estimator."""
+    steps = getattr(model, "steps", None)
+    if steps is None:
+        return None, model
+    if len(steps) == 1:
+        return None, steps[0][1]
+    if len(steps) == 2:
+        return steps[0][1], steps[1][1]
+    raise ValueError(f"Unsupported pipeline with {len(steps)} steps")
+
+
+def compile_linear(model) -> CompiledLinearPredictor:
+    """Fold an optional ``StandardScaler`` and a fitted linear estimator into one affine map."""
+    scaler, estimator = _split_pipeline(model)
+
+    coef = np.asarray(getattr(estimator, "coef_"), dtype=np.float64)
+    intercept = np.asarray(getattr(estimator, "intercept_", 0.0), dtype=np.float64)
+    if coef.ndim == 2:
+        if coef.shape[0] != 1:
+            raise ValueError("Only single-target linear models can be compiled")
+        coef = coef[0]
+    intercept = float(intercept.ravel()[0]) if intercept.ndim else float(intercept)
+
+    if scaler is not None:
+        if type(scaler).__name__ != "StandardScaler":
+            raise ValueError(f"Unsupported preprocessing step: {type(scaler).__name__}")
+        # mean_ is fitted even with with_mean=False, but transform only subtracts it when with_mean is set
+        mean = scaler.mean_ if scaler.with_mean and scaler.mean_ is not None else np.zeros_like(coef)
+        scale = scaler.scale_ if scaler.scale_ is not None else np.ones_like(coef)
+        coef = coef / scale
+        intercept = intercept - float(np.dot(mean, coef))
+
+    return CompiledLinearPredictor(coef, intercept)
+
+
+def _probe_batch(n_features: int, model) -> np.ndarray:
+    """Deterministic inputs around the training distribution for the parity check."""
+    scaler, _ = _split_pipeline(model)
+    rng = np.random.default_rng(0)
+    probe = rng.standard_normal((32, n_features))
+    if scaler is not None:
+        if getattr(scaler, "scale_", None) is not None:
+            probe = probe * scaler.scale_
+        if getattr(scaler, "mean_", None) is not None:
+            probe = probe + scaler.mean_
+    return probe
+
+
+def make_predictor(model, mode: str = "compiled"):
+    """
+    Build the predictor used on the serving path.
+
+    ``mode="compiled"`` tries the NumPy fast path and keeps it only if it matches sklearn's
+    output on a probe batch; anything unsupported falls back to ``SklearnPredictor``.
+    """
+    fallback = SklearnPredictor(model)
+    if mode != "compiled":
+        return fallback
+
+    try:
+        compiled = compile_linear(model)
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.info(f"Compiled predictor unavailable for {type(model).__name__}: {e}")
+        return fallback
+
+    probe = _probe_batch(len(compiled.coef), model)
+    expected = fallback.predict(probe)
+    if not np.allclose(compiled.predict(probe), expected, rtol=1e-9, atol=1e-9 * max(1.0, np.abs(expected).max())):
+        logger.warning("Compiled predictor disagrees with sklearn output, using the sklearn path")
+        return fallback
+    return compiled
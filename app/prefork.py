@@ -0,0 +1,113 @@
+"""
+Pre-forked multi-worker serving.
+
+    python prefork.py --workers 4 --host 0.0.0.0 --port 8000
+
+``uvicorn --workers N`` spawns fresh interpreters, and each one imports ``main``, downloads
+the model and unpickles its own copy. This launcher instead imports the app and loads the
+default model once, in the parent. It binds the listening socket, then forks the workers.
+Children inherit the parent's loaded model and imported libraries, and those pages stay
+shared until a process writes to them. ``gc.freeze()`` keeps the collector from touching the
+inherited objects and un-sharing their pages.
+
+With ``MODEL_MMAP=true`` and ``MODEL_CACHE_DIR`` set, model arrays are also memory-mapped
+from the cached artifact. Versions loaded later by hot reload are then shared through the
+page cache too, not only the one loaded before the fork.
+
+Each worker runs the normal startup hooks. It finds the model already loaded and only polls
+for new versions. Prometheus metrics are per worker: a scrape sees the worker that answered it.
+"""
+import argparse
+import gc
+import logging
+import os
+import signal
+import sys
+import time
+
+import uvicorn
+
+logger = logging.getLogger("prefork")
+
+
+def run_worker(app_module, config: uvicorn.Config, sock) -> None:
+    app_module.reinit_after_fork()
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve():
+    parser = argparse.ArgumentParser(description="Serve the app from N workers forked after the model is loaded")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))))
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    import main as app_module
+
+    try:
+        # One fetch and unpickle for every worker
+        app_module.model_store.refresh()
+    except Exception as e:
+        logger.warning(f"Model load before fork failed, workers will load it themselves: {e}")
+
+    config = uvicorn.Config(app_module.app, host=args.host, port=args.port, log_level=args.log_level)
+    sock = config.bind_socket()
+
+    # Move everything allocated so far out of the collector's reach, so it never writes to those pages
+    gc.collect()
+    gc.freeze()
+
+    workers = {}
+    shutting_down = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                run_worker(app_module, config, sock)
+            finally:
+                os._exit(0)
+        workers[pid] = time.monotonic()
+        logger.info(f"Started worker {pid}")
+
+    def stop(signum, frame) -> None:
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(args.workers):
+        spawn()
+    logger.info(f"Serving on {args.host}:{args.port} with {args.workers} pre-forked workers")
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        started_at = workers.pop(pid, None)
+        if started_at is None or shutting_down:
+            continue
+        logger.warning(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}, restarting")
+        # Don't spin if workers die right after starting
+        if time.monotonic() - started_at < 1:
+            time.sleep(1)
+        spawn()
+
+    sock.close()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    serve()
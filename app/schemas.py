@@ -0,0 +1,145 @@
+"""
+Request and response models of the KServe v2 inference routes.
+
+Tensor data is validated straight into NumPy arrays (``FloatArray``) instead of being walked as
+Python lists, and ``InferenceRequest.features`` holds the ``[N, 8]`` feature matrix once the
+request is valid. Anything that does not fit raises ``pydantic.ValidationError`` (a 422).
+"""
+from typing import Annotated, Any, Dict, List, Optional, Union
+
+import numpy as np
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PrivateAttr, model_validator
+
+# Feature order expected by the model (matches the training columns)
+FEATURE_NAMES = ["Open", "High", "Low", "Adj_Close", "Volume", "year", "month", "day"]
+
+# Defaults used when a named input omits a feature
+FEATURE_DEFAULTS = {"Open": 0, "High": 0, "Low": 0, "Adj_Close": 0, "Volume": 0,
+                    "year": 2024, "month": 1, "day": 1}
+
+
+class InvalidRequest(ValueError):
+    """Raised when a request body cannot be decoded at all (malformed JSON or binary framing); a 400."""
+
+
+def to_float_array(value) -> np.ndarray:
+    try:
+        return np.asarray(value, dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Expected numeric tensor data: {e}") from e
+
+
+FloatArray = Annotated[np.ndarray, BeforeValidator(to_float_array)]
+
+
+class InferInputTensor(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str = ""
+    shape: List[int] = []
+    datatype: str = "FP32"
+    parameters: Optional[Dict[str, Any]] = None
+    data: FloatArray
+
+
+class RequestedOutput(BaseModel):
+    name: str
+    parameters: Optional[Dict[str, Any]] = None
+
+
+class InferenceRequest(BaseModel):
+    """
+    Body of ``:predict`` and ``/infer``. ``inputs`` may be:
+      - a single row of 8 values: ``[o, h, l, ac, v, y, m, d]``
+      - an ``[N, 8]`` tensor as nested lists: ``[[...], [...]]``
+      - named inputs for one row, or columnar lists: ``{"Open": 1.0, ...}`` / ``{"Open": [..], ...}``
+      - a list of named-input rows: ``[{"Open": 1.0, ...}, ...]``
+      - KServe v2 tensors, either one ``[N, 8]`` tensor or one ``[N]`` tensor per feature name
+      - a NumPy array decoded from a binary request body
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    id: Optional[str] = None
+    # Tried in order: plain arrays first, since np.asarray rejects the dict layouts quickly
+    inputs: Union[FloatArray, List[InferInputTensor], List[Dict[str, float]], Dict[str, FloatArray]] = Field(
+        union_mode="left_to_right")
+    parameters: Optional[Dict[str, Any]] = None
+    outputs: Optional[List[RequestedOutput]] = None
+
+    _features: np.ndarray = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _build_features(self):
+        self._features = _to_features(self.inputs)
+        return self
+
+    @property
+    def features(self) -> np.ndarray:
+        return self._features
+
+
+class InferOutputTensor(BaseModel):
+    name: str
+    datatype: str
+    shape: List[int]
+    data: Optional[List[float]] = None
+    parameters: Optional[Dict[str, Any]] = None
+
+
+class InferenceResponse(BaseModel):
+    model_name: str
+    model_version: str
+    id: Optional[str] = None
+    outputs: List[InferOutputTensor]
+
+
+def _to_features(inputs) -> np.ndarray:
+    if isinstance(inputs, np.ndarray):
+        features = inputs.reshape(1, -1) if inputs.ndim == 1 else inputs
+    elif isinstance(inputs, dict):
+        columns = _named_row(inputs)
+        n_rows = max((np.size(column) for column in columns if np.ndim(column) == 1), default=1)
+        features = np.empty((n_rows, len(FEATURE_NAMES)))
+        for i, column in enumerate(columns):
+            # Scalars broadcast over every row; a column of the wrong length raises ValueError
+            features[:, i] = column
+    elif inputs and isinstance(inputs[0], InferInputTensor):
+        features = _from_v2_tensors(inputs)
+    elif inputs:
+        features = np.array([_named_row(row) for row in inputs], dtype=np.float64)
+    else:
+        raise ValueError("Invalid input format")
+
+    if features.ndim != 2 or features.shape[1] != len(FEATURE_NAMES):
+        raise ValueError(f"Expected {len(FEATURE_NAMES)} input values per row, got shape {list(features.shape)}")
+    # JSON null arrives as NaN; neither it nor an infinity can be scored
+    if not np.isfinite(features).all():
+        raise ValueError("Input values must be finite numbers (no null, NaN or infinity)")
+    return features
+
+
+def _named_row(named: dict) -> list:
+    """Values of a named input in ``FEATURE_NAMES`` order, with defaults for omitted features."""
+    unknown = sorted(set(named) - set(FEATURE_NAMES))
+    if unknown:
+        raise ValueError(f"Unknown input names: {unknown}, expected names from {FEATURE_NAMES}")
+    return [named.get(name, FEATURE_DEFAULTS[name]) for name in FEATURE_NAMES]
+
+
+def _from_v2_tensors(tensors: List[InferInputTensor]) -> np.ndarray:
+    """Build the feature matrix from one ``[N, 8]`` tensor or one ``[N]`` tensor per feature."""
+    if len(tensors) == 1:
+        tensor = tensors[0]
+        shape = tensor.shape if len(tensor.shape) == 2 else [-1, len(FEATURE_NAMES)]
+        return tensor.data.reshape(shape)
+
+    by_name = {tensor.name: tensor for tensor in tensors}
+    missing = [name for name in FEATURE_NAMES if name not in by_name]
+    if missing:
+        raise ValueError(f"Missing input tensors: {missing}")
+    return np.column_stack([by_name[name].data.ravel() for name in FEATURE_NAMES])
+
+
+def parse_inputs(inputs) -> np.ndarray:
+    """Validate an ``inputs`` value on its own and return its ``[N, 8]`` feature matrix."""
+    return InferenceRequest(inputs=inputs).features
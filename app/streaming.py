@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import numpy as np
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from schemas import InferenceRequest
+from tensor_codec import decode_json, decode_npy, encode_json
+
+logger = logging.getLogger(__name__)
+
+# Close code for a consumer that stopped reading its predictions (RFC 6455 "try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class StreamItem:
+    """One received message: its feature rows, or the error to send back in its place."""
+    __slots__ = ("id", "features", "error")
+
+    def __init__(self, id: Optional[str], features: Optional[np.ndarray] = None, error: Optional[str] = None):
+        self.id = id
+        self.features = features
+        self.error = error
+
+
+class StreamSession:
+    """
+    One WebSocket prediction stream.
+
+    A reader task parses each message (a JSON ``{"id", "inputs"}`` object in any layout the
+    REST routes accept, or a binary ``.npy`` array) into a bounded per-connection queue. The
+    scoring loop groups messages that arrive within ``max_wait_us`` of each other (up to
+    ``max_batch_rows`` rows) into one ``score_fn`` call and sends one reply per message, in order.
+
+    Backpressure: the loop only takes the next batch once the previous replies are written, and
+    the reader stops reading from the socket while ``max_pending`` messages are queued, so a slow
+    consumer is throttled by TCP flow control instead of growing server memory. A consumer that
+    does not accept a reply within ``send_timeout_s`` is disconnected.
+    """
+
+    def __init__(self, websocket: WebSocket, score_fn: Callable[[np.ndarray], Awaitable[Tuple[np.ndarray, str]]],
+                 max_pending: int = 256, max_batch_rows: int = 64, max_wait_us: int = 2000,
+                 send_timeout_s: float = 10.0):
+        self.websocket = websocket
+        self.score_fn = score_fn
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait_us / 1_000_000
+        self.send_timeout_s = send_timeout_s
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self.messages = 0
+
+    async def run(self) -> bool:
+        """Serve the stream until the client disconnects; False if it was cut off as a slow consumer."""
+        reader = asyncio.create_task(self._read())
+        try:
+            while True:
+                batch, closing = await self._collect()
+                if batch and not await self._score(batch):
+                    return False
+                if closing:
+                    return True
+        finally:
+            reader.cancel()
+
+    async def _read(self) -> None:
+        try:
+            while True:
+                message = await self.websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                # Blocks while the queue is full, which stops reading from the socket
+                await self._queue.put(self._parse(message))
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            logger.warning(f"Prediction stream receive failed: {e}")
+        # Tell the scoring loop to finish once it has replied to everything queued
+        await self._queue.put(None)
+
+    @staticmethod
+    def _parse(message: dict) -> StreamItem:
+        request_id = None
+        try:
+            if message.get("bytes") is not None:
+                request = InferenceRequest(inputs=decode_npy(message["bytes"]))
+            else:
+                body = decode_json(message.get("text") or "")
+                if not isinstance(body, dict):
+                    raise ValueError("Message must be a JSON object")
+                request_id = body.get("id")
+                request = InferenceRequest.model_validate(body)
+            return StreamItem(request.id, features=request.features)
+        except ValueError as e:
+            return StreamItem(request_id, error=str(e))
+
+    async def _collect(self) -> Tuple[List[StreamItem], bool]:
+        """Wait for a message, then keep collecting until the batch is full or ``max_wait_us`` passed."""
+        item = await self._queue.get()
+        if item is None:
+            return [], True
+        batch = [item]
+        rows = len(item.features) if item.features is not None else 0
+        deadline = time.monotonic() + self.max_wait
+
+        while rows < self.max_batch_rows:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+            rows += len(item.features) if item.features is not None else 0
+        return batch, False
+
+    async def _score(self, batch: List[StreamItem]) -> bool:
+        """Score ``batch`` and send its replies; False if the consumer was too slow and should be disconnected."""
+        valid = [item for item in batch if item.features is not None]
+        predictions, model_version, error = None, None, None
+        if valid:
+            try:
+                predictions, model_version = await self.score_fn(np.vstack([item.features for item in valid]))
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+
+        offset = 0
+        for item in batch:
+            if item.features is None:
+                reply = {"id": item.id, "error": item.error}
+            elif error is not None:
+                reply = {"id": item.id, "error": error}
+            else:
+                end = offset + len(item.features)
+                reply = {"id": item.id, "model_version": model_version, "predictions": predictions[offset:end]}
+                offset = end
+            try:
+                await asyncio.wait_for(self.websocket.send_text(encode_json(reply).decode()), self.send_timeout_s)
+            except asyncio.TimeoutError:
+                logger.warning(f"Closing prediction stream: consumer did not read for {self.send_timeout_s}s")
+                return False
+            self.messages += 1
+        return True
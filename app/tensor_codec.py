@@ -0,0 +1,123 @@
+"""
+Binary request/response encodings for bulk scoring.
+
+- KServe v2 binary data extension: a JSON header of ``Inference-Header-Content-Length`` bytes
+  followed by the raw little-endian tensors, each sized by ``parameters.binary_data_size``.
+- Raw ``.npy`` bodies (``application/x-npy``).
+- Arrow IPC streams (``application/vnd.apache.arrow.stream``) with one column per feature.
+- Plain JSON through orjson, which writes NumPy arrays without a ``tolist()`` round trip.
+
+All decoders map the body straight into NumPy arrays without per-element Python objects.
+"""
+import io
+from typing import Dict, List, Tuple
+
+import numpy as np
+import orjson
+
+V2_HEADER_LENGTH = "inference-header-content-length"
+NPY_CONTENT_TYPE = "application/x-npy"
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+V2_DATATYPES = {
+    "BOOL": np.dtype("?"),
+    "UINT8": np.dtype("<u1"), "UINT16": np.dtype("<u2"), "UINT32": np.dtype("<u4"), "UINT64": np.dtype("<u8"),
+    "INT8": np.dtype("<i1"), "INT16": np.dtype("<i2"), "INT32": np.dtype("<i4"), "INT64": np.dtype("<i8"),
+    "FP16": np.dtype("<f2"), "FP32": np.dtype("<f4"), "FP64": np.dtype("<f8"),
+}
+
+
+def decode_v2_binary(body: bytes, header_length: int) -> dict:
+    """
+    Split a v2 binary request into its JSON header and tensors.
+    Binary inputs get their ``data`` replaced by a NumPy view over the request buffer.
+    """
+    header = orjson.loads(body[:header_length])
+    offset = header_length
+    for tensor in header.get("inputs", []):
+        size = (tensor.get("parameters") or {}).get("binary_data_size")
+        if size is None:
+            continue
+        dtype = V2_DATATYPES.get(tensor.get("datatype"))
+        if dtype is None:
+            raise ValueError(f"Unsupported binary datatype: {tensor.get('datatype')}")
+        if offset + size > len(body):
+            raise ValueError(f"Binary data for input '{tensor.get('name')}' is truncated")
+        data = np.frombuffer(body, dtype=dtype, count=size // dtype.itemsize, offset=offset)
+        tensor["data"] = data.reshape(tensor["shape"]) if tensor.get("shape") else data
+        offset += size
+    return header
+
+
+def wants_v2_binary_output(header: dict) -> bool:
+    """True if the request asked for binary outputs, globally or on any requested output."""
+    if (header.get("parameters") or {}).get("binary_data_output"):
+        return True
+    return any((output.get("parameters") or {}).get("binary_data") for output in header.get("outputs") or [])
+
+
+def encode_v2_binary(payload: dict, tensors: Dict[str, np.ndarray]) -> Tuple[bytes, int]:
+    """
+    Serialize a v2 response with the named output tensors in binary form.
+    Returns the body and the JSON header length for ``Inference-Header-Content-Length``.
+    """
+    chunks: List[bytes] = []
+    for output in payload["outputs"]:
+        array = tensors.get(output["name"])
+        if array is None:
+            continue
+        raw = np.ascontiguousarray(array, dtype=V2_DATATYPES[output["datatype"]]).tobytes()
+        output.pop("data", None)
+        output["parameters"] = {"binary_data_size": len(raw)}
+        chunks.append(raw)
+
+    header = orjson.dumps(payload)
+    return header + b"".join(chunks), len(header)
+
+
+def decode_json(body: bytes) -> dict:
+    return orjson.loads(body)
+
+
+def encode_json(payload: dict) -> bytes:
+    """Serialize ``payload``; NumPy arrays in it are written directly by orjson."""
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def decode_npy(body: bytes) -> np.ndarray:
+    """Read a ``.npy`` body; an empty, truncated or malformed one raises ``ValueError``."""
+    try:
+        return np.load(io.BytesIO(body), allow_pickle=False)
+    except (ValueError, EOFError, OSError) as e:
+        raise ValueError(f"Invalid .npy body: {e or type(e).__name__}") from e
+
+
+def encode_npy(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def decode_arrow(body: bytes, feature_names: List[str]) -> np.ndarray:
+    """Read an Arrow IPC stream with one column per feature into an ``[N, len(feature_names)]`` array."""
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(body).read_all()
+    missing = [name for name in feature_names if name not in table.column_names]
+    if missing:
+        raise ValueError(f"Missing input columns: {missing}")
+
+    features = np.empty((table.num_rows, len(feature_names)), dtype=np.float64)
+    for i, name in enumerate(feature_names):
+        features[:, i] = table.column(name).to_numpy()
+    return features
+
+
+def encode_arrow(columns: Dict[str, np.ndarray]) -> bytes:
+    import pyarrow as pa
+
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
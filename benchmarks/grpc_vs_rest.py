@@ -0,0 +1,120 @@
+"""
+Compare per-request latency of the KServe v2 gRPC endpoint against the REST routes.
+
+Start the app with the gRPC endpoint enabled, e.g. against a local model directory:
+
+    cd app && GRPC_ENABLED=true MODEL_LOCAL_DIR=/path/to/models uvicorn main:app --port 8000
+
+then run:
+
+    python benchmarks/grpc_vs_rest.py --requests 2000 --rows 1 --rows 64
+
+For each batch size it sends the same feature matrix sequentially over REST JSON, REST with
+the v2 binary extension and gRPC with raw tensor contents, and prints latency percentiles as JSON.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import grpc
+import numpy as np
+import requests
+
+# The generated stubs live next to the app and use flat imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+import grpc_predict_v2_pb2 as pb  # noqa: E402
+import grpc_predict_v2_pb2_grpc as pb_grpc  # noqa: E402
+
+
+def make_features(rows: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(100, 700, size=(rows, 4))
+    volume = rng.uniform(1e6, 5e7, size=(rows, 1))
+    dates = np.tile([2024, 1, 15], (rows, 1))
+    return np.hstack([prices, volume, dates]).astype(np.float32)
+
+
+def rest_json(session, url, features):
+    body = {"inputs": [{"name": "input-0", "shape": list(features.shape), "datatype": "FP32",
+                        "data": features.ravel().tolist()}]}
+    response = session.post(url, json=body)
+    response.raise_for_status()
+    return response.json()["outputs"][0]["data"]
+
+
+def rest_binary(session, url, features):
+    raw = features.tobytes()
+    header = json.dumps({
+        "inputs": [{"name": "input-0", "shape": list(features.shape), "datatype": "FP32",
+                    "parameters": {"binary_data_size": len(raw)}}],
+        "parameters": {"binary_data_output": True},
+    }).encode()
+    response = session.post(url, data=header + raw, headers={
+        "Content-Type": "application/octet-stream", "Inference-Header-Content-Length": str(len(header))})
+    response.raise_for_status()
+    header_length = int(response.headers["Inference-Header-Content-Length"])
+    return np.frombuffer(response.content, dtype="<f4", offset=header_length)
+
+
+def grpc_infer(stub, model_name, features):
+    request = pb.ModelInferRequest(
+        model_name=model_name,
+        inputs=[pb.ModelInferRequest.InferInputTensor(name="input-0", datatype="FP32", shape=features.shape)],
+        raw_input_contents=[features.tobytes()],
+    )
+    response = stub.ModelInfer(request)
+    return np.frombuffer(response.raw_output_contents[0], dtype="<f4")
+
+
+def measure(call, n_requests: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        call()
+    latencies = np.empty(n_requests)
+    start = time.perf_counter()
+    for i in range(n_requests):
+        t0 = time.perf_counter()
+        call()
+        latencies[i] = time.perf_counter() - t0
+    elapsed = time.perf_counter() - start
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1e3
+    return {"requests_per_s": round(n_requests / elapsed, 1), "p50_ms": round(p50, 3),
+            "p95_ms": round(p95, 3), "p99_ms": round(p99, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rest-url", default="http://localhost:8000")
+    parser.add_argument("--grpc-target", default="localhost:8081")
+    parser.add_argument("--model", default="fastapi-serve")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--rows", type=int, action="append", help="Rows per request (repeatable, default 1)")
+    args = parser.parse_args()
+
+    url = f"{args.rest_url}/v1/models/{args.model}/infer"
+    session = requests.Session()
+    channel = grpc.insecure_channel(args.grpc_target)
+    stub = pb_grpc.GRPCInferenceServiceStub(channel)
+    if not stub.ServerReady(pb.ServerReadyRequest()).ready:
+        sys.exit("gRPC server is not ready")
+
+    results = {}
+    for rows in args.rows or [1]:
+        features = make_features(rows)
+        # All three paths must agree before their timings mean anything
+        expected = np.asarray(rest_json(session, url, features), dtype=np.float32)
+        np.testing.assert_allclose(rest_binary(session, url, features), expected, rtol=1e-5)
+        np.testing.assert_allclose(grpc_infer(stub, args.model, features), expected, rtol=1e-5)
+
+        results[f"rows={rows}"] = {
+            "rest_json": measure(lambda: rest_json(session, url, features), args.requests, args.warmup),
+            "rest_binary": measure(lambda: rest_binary(session, url, features), args.requests, args.warmup),
+            "grpc": measure(lambda: grpc_infer(stub, args.model, features), args.requests, args.warmup),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
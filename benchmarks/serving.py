@@ -0,0 +1,226 @@
+"""
+Load test of the serving app with a local model file in place of S3.
+
+Starts ``uvicorn main:app`` from ``app/`` with ``MODEL_LOCAL_DIR`` pointing at a temporary model
+directory, drives ``/predict``, ``:predict`` and ``/infer`` with a closed loop of concurrent
+clients per scenario (route x rows per request x concurrency), and prints or writes the
+throughput and latency percentiles as JSON:
+
+    python benchmarks/serving.py --concurrency 1 --concurrency 16 --rows 1 --rows 64 --output bench.json
+
+Pass a previous result as ``--baseline`` to compare; the exit status is 1 if any scenario's
+p50/p95/p99 got slower, or its throughput lower, than the baseline by more than ``--tolerance``.
+
+Without ``--model`` a small scaler + linear regression pipeline is fitted with a fixed seed, so
+runs are reproducible on any machine. App settings can be passed through with ``--env KEY=VALUE``
+(e.g. ``--env BATCHING_ENABLED=true``).
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import joblib
+import numpy as np
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+ROUTES = ["/predict", ":predict", "/infer"]
+FORM_FIELDS = ["Open", "High", "Low", "Adj_Close", "Volume", "year", "month", "day"]
+# A latency or throughput change within this fraction of the baseline is noise
+DEFAULT_TOLERANCE = 0.10
+
+
+def make_features(rows: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    prices = rng.uniform(100, 700, size=(rows, 4))
+    volume = rng.uniform(1e6, 5e7, size=(rows, 1))
+    dates = np.column_stack([rng.integers(2002, 2025, rows), rng.integers(1, 13, rows), rng.integers(1, 29, rows)])
+    return np.hstack([prices, volume, dates])
+
+
+def fit_reference_model(path: str) -> None:
+    """Fit the same scaler + regressor pipeline shape ModelTraining produces, on synthetic data."""
+    from sklearn.linear_model import LinearRegression
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    X = make_features(5000, seed=42)
+    y = X[:, :4].mean(axis=1) + np.random.default_rng(42).normal(0, 1, len(X))
+    model = Pipeline(steps=[("scaler", StandardScaler()), ("model", LinearRegression())]).fit(X, y)
+    joblib.dump(model, path)
+
+
+def build_request(route: str, model_name: str, features: np.ndarray) -> dict:
+    """``httpx`` request arguments for one call of ``route``."""
+    if route == "/predict":
+        return {"url": "/predict", "data": {name: str(value) for name, value in zip(FORM_FIELDS, features[0])}}
+    url = f"/v1/models/{model_name}{route}"
+    return {"url": url, "json": {"inputs": [{"name": "input-0", "shape": list(features.shape), "datatype": "FP32",
+                                             "data": features.ravel().tolist()}]}}
+
+
+async def run_scenario(base_url: str, request: dict, rows: int, concurrency: int, n_requests: int,
+                       warmup: int) -> dict:
+    """Send ``n_requests`` from ``concurrency`` clients, each waiting for its reply before the next call."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        for _ in range(warmup):
+            await client.post(**request)
+
+        latencies = []
+        statuses = {}
+        remaining = n_requests
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                try:
+                    response = await client.post(**request)
+                    status = str(response.status_code)
+                except httpx.HTTPError as e:
+                    status = type(e).__name__
+                latencies.append(time.perf_counter() - start)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1e3
+    return {
+        "requests": len(latencies),
+        "errors": sum(count for status, count in statuses.items() if status != "200"),
+        "statuses": statuses,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "rows_per_s": round(len(latencies) * rows / elapsed, 1),
+        "mean_ms": round(float(np.mean(latencies)) * 1e3, 3),
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Scenarios slower (or lower throughput) than ``baseline`` by more than ``tolerance``."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            change = current[metric] / previous[metric] - 1 if previous[metric] else 0.0
+            current.setdefault("vs_baseline", {})[metric] = round(change, 3)
+            if change > tolerance:
+                regressions.append(f"{name}: {metric} {previous[metric]} -> {current[metric]} (+{change:.0%})")
+        change = current["throughput_rps"] / previous["throughput_rps"] - 1 if previous["throughput_rps"] else 0.0
+        current["vs_baseline"]["throughput_rps"] = round(change, 3)
+        if change < -tolerance:
+            regressions.append(f"{name}: throughput_rps {previous['throughput_rps']} -> "
+                               f"{current['throughput_rps']} ({change:.0%})")
+    return regressions
+
+
+def start_app(model_dir: str, port: int, env_overrides: dict) -> subprocess.Popen:
+    env = {**os.environ, "MODEL_LOCAL_DIR": model_dir, "MODEL_RELOAD_INTERVAL_S": "0", **env_overrides}
+    env.pop("S3_BUCKET_NAME", None)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=APP_DIR, env=env,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited during startup with status {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("App did not become healthy within 60s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", help="Model artifact to serve (default: fit a reference pipeline)")
+    parser.add_argument("--route", action="append", choices=ROUTES, help="Routes to drive (default: all)")
+    parser.add_argument("--rows", type=int, action="append", help="Rows per request (repeatable, default 1); "
+                                                                   "/predict always sends one row")
+    parser.add_argument("--concurrency", type=int, action="append", help="Concurrent clients (repeatable, "
+                                                                          "default 1 and 8)")
+    parser.add_argument("--requests", type=int, default=1000, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=50, help="Unmeasured requests before each scenario")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="App environment override")
+    parser.add_argument("--output", help="Write the JSON report here as well as to stdout")
+    parser.add_argument("--baseline", help="Previous JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    env_overrides = dict(item.split("=", 1) for item in args.env)
+    model_dir = tempfile.mkdtemp(prefix="bench-models-")
+    model_path = os.path.join(model_dir, "models", "model.pkl")
+    os.makedirs(os.path.dirname(model_path))
+    if args.model:
+        shutil.copyfile(args.model, model_path)
+    else:
+        fit_reference_model(model_path)
+
+    process = start_app(model_dir, args.port, env_overrides)
+    results = {}
+    try:
+        for route in args.route or ROUTES:
+            for rows in ([1] if route == "/predict" else args.rows or [1]):
+                request = build_request(route, "fastapi-serve", make_features(rows))
+                for concurrency in args.concurrency or [1, 8]:
+                    name = f"{route} rows={rows} concurrency={concurrency}"
+                    results[name] = asyncio.run(run_scenario(f"http://127.0.0.1:{args.port}", request, rows,
+                                                             concurrency, args.requests, args.warmup))
+                    print(f"{name}: {results[name]['throughput_rps']} req/s, p50 {results[name]['p50_ms']}ms, "
+                          f"p99 {results[name]['p99_ms']}ms", file=sys.stderr)
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(model_dir, ignore_errors=True)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+
+    commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    report = {
+        "meta": {
+            "commit": commit or None,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "model": args.model or "reference",
+            "requests_per_scenario": args.requests,
+            "env": env_overrides,
+        },
+        "results": results,
+        "regressions": regressions,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,45 @@
 import kfp
-from kfp import dsl
+from kfp import dsl, kubernetes
 from kfp.dsl import component
 
 
 BASE_IMAGE = "bharat9838/kubeflow_pipeline:latest-v3"
 
+# Every step mounts this claim over the image's artifacts/ directory, so a step finds the files
+# its upstream wrote and the stage-cache manifests survive from one run to the next
+ARTIFACTS_PVC = "ml-pipeline-artifacts"
+ARTIFACTS_MOUNT_PATH = "/app/artifacts"
+
 
 # ===== Upload Component =====
 @component(base_image=BASE_IMAGE)
-def upload_data() -> int:
+def upload_data(force: bool = False):
 
     import logging
-    from src.logger import logging as custom_logging  # If you have custom logger
+    from src.constants import DATA_UPLOAD_STAGE_NAME
     from src.pipeline.stage01_data_upload import DataUploadPipeline
+    from src.pipeline.stage_cache import run_stage
 
     try:
-        data_ingestion = DataUploadPipeline()
-        data_ingestion.main()
-        logging.info(f"✅ Uploaded {len(data_ingestion)} files to S3.")
-        return len(data_ingestion)
+        logging.info("Upload Stage started.")
+        run_stage(DataUploadPipeline, DATA_UPLOAD_STAGE_NAME, force=force)
+        logging.info("✅ Upload Stage completed.")
     except Exception as e:
         logging.error(f"❌ Upload Stage failed: {e}")
         raise e
 
 # ===== Ingestion Component =====
 @component(base_image=BASE_IMAGE)
-def ingest_data():
+def ingest_data(force: bool = False):
 
     import logging
+    from src.constants import INGESTION_STAGE_NAME
     from src.pipeline.stage02_data_ingestion import DataIngestionPipeline
+    from src.pipeline.stage_cache import run_stage
     
     try:
         logging.info("Ingestion Stage started.")
-        data_processing= DataIngestionPipeline()
-        data_processing.main()
+        run_stage(DataIngestionPipeline, INGESTION_STAGE_NAME, force=force)
         logging.info("Ingestion Stage completed.")
     except Exception as e:
         logging.error(f"Ingestion Stage failed: {e}")
@@ -41,15 +47,16 @@ def ingest_data():
 
 # ===== Preprocessing Component =====
 @component(base_image=BASE_IMAGE)
-def preprocess_data():
+def preprocess_data(force: bool = False):
     
     import logging
+    from src.constants import PRE_PROCESSING_STAGE_NAME
     from src.pipeline.stage03_data_processing import DataProcessingPipeline
+    from src.pipeline.stage_cache import run_stage
 
     try:
         logging.info("Preprocessing Stage started.")
-        data_processing= DataProcessingPipeline()
-        data_processing.main()
+        run_stage(DataProcessingPipeline, PRE_PROCESSING_STAGE_NAME, force=force)
         logging.info("Preprocessing Stage completed.")
     except Exception as e:
         logging.error(f"Preprocessing Stage failed: {e}")
@@ -57,16 +64,17 @@ def preprocess_data():
 
 # ===== Model Training Component =====
 @component(base_image=BASE_IMAGE)
-def train_model():
+def train_model(force: bool = False):
     import pandas as pd
     from src.config import CONFIG
+    from src.constants import MODEL_TRAINING_STAGE_NAME
     from src.pipeline.stage04_model_training import ModelPipeline
+    from src.pipeline.stage_cache import run_stage
     from src.logger import logging
 
     try:
         logging.info("Model Training Stage started.")
-        selection = ModelPipeline()
-        selection.main()
+        run_stage(ModelPipeline, MODEL_TRAINING_STAGE_NAME, force=force)
         logging.info("Model Training Stage completed.")
     except Exception as e:
         logging.error(f"Model Training failed: {e}")
@@ -77,12 +85,19 @@ def train_model():
     name="End-to-End ML Pipeline",
     description="Pipeline for data upload, ingestion, preprocessing, and training"
 )
-def ml_pipeline():
-    # Define pipeline steps with proper dependencies
-    step1 = upload_data()
-    step2 = ingest_data().after(step1)
-    step3 = preprocess_data().after(step2)
-    step4 = train_model().after(step3)
+def ml_pipeline(force: bool = False, artifacts_pvc: str = ARTIFACTS_PVC):
+    # Define pipeline steps with proper dependencies. Each step skips itself when its inputs
+    # match the manifest of its last run (see src/pipeline/stage_cache.py); force reruns all.
+    # The manifests live on the artifacts_pvc claim, which must exist before the first run.
+    step1 = upload_data(force=force)
+    step2 = ingest_data(force=force).after(step1)
+    step3 = preprocess_data(force=force).after(step2)
+    step4 = train_model(force=force).after(step3)
+
+    for step in (step1, step2, step3, step4):
+        kubernetes.mount_pvc(step, pvc_name=artifacts_pvc, mount_path=ARTIFACTS_MOUNT_PATH)
+        # A skipped step has no new outputs; let the stage cache decide instead of KFP's cache
+        step.set_caching_options(False)
     
     # Optional: Set resource requirements for components
     step1.set_memory_limit('2Gi').set_cpu_limit('1')
@@ -0,0 +1,39 @@
+"""
+Offline batch scoring of large CSV/Parquet files with the trained model.
+
+    python -m src.batch_score --input data/history.csv --output artifacts/predictions/history.parquet
+
+The input needs the raw training columns (Date, Open, High, Low, Adj Close, Volume); every input
+column is written back with an added ``prediction`` column. Defaults come from ``batch_scoring``
+in config.yaml.
+"""
+import argparse
+import sys
+from src.constants import *
+from src.logger import logging
+from src.exception import MyException
+from src.components.batch_scoring import BatchScoring
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Score a CSV/Parquet file with the trained model.")
+    parser.add_argument("--input", required=True, help="CSV or Parquet file to score")
+    parser.add_argument("--output", required=True, help="Destination .csv or .parquet file")
+    parser.add_argument("--model", help="Local model artifact (default: batch_scoring.model, fetched from S3 "
+                                        "if missing)")
+    parser.add_argument("--chunk-size", type=int, help="Rows read and scored per chunk")
+    parser.add_argument("--workers", type=int, help="Scoring processes; 1 scores in-process")
+    parser.add_argument("--format", choices=["csv", "parquet"], help="Output format (default: from --output)")
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    try:
+        logging.info(f">>>>>> stage {BATCH_SCORING_STAGE_NAME} started <<<<<<")
+        BatchScoring().score_file(args.input, args.output, model_path=args.model, chunk_size=args.chunk_size,
+                                  workers=args.workers, output_format=args.format)
+        logging.info(f">>>>>> stage {BATCH_SCORING_STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except MyException as e:
+        logging.exception(e, sys)
+        raise e
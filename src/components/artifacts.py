@@ -0,0 +1,172 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from src.config import CONFIG
+from src.logger import logging
+
+# File suffix of each intermediate artifact format
+ARTIFACT_SUFFIXES = {"csv": ".csv", "parquet": ".parquet", "npy": ".npy"}
+
+
+def artifact_settings() -> dict:
+    """The ``artifacts`` section of config.yaml, with defaults for trees that predate it."""
+    settings = CONFIG.get("artifacts", {})
+    artifact_format = settings.get("format", "csv")
+    if artifact_format not in ARTIFACT_SUFFIXES:
+        raise ValueError(f"Unknown artifact format '{artifact_format}', expected one of {list(ARTIFACT_SUFFIXES)}")
+    return {"format": artifact_format,
+            "downcast": settings.get("downcast", False),
+            "mmap": settings.get("mmap", True)}
+
+
+def artifact_path(path: str, artifact_format: str = None) -> str:
+    """``path`` (as written in config.yaml) with the suffix of the configured artifact format."""
+    artifact_format = artifact_format or artifact_settings()["format"]
+    return os.path.splitext(path)[0] + ARTIFACT_SUFFIXES[artifact_format]
+
+
+def downcast_frame(df: pd.DataFrame, dtypes: dict = None) -> pd.DataFrame:
+    """
+    Returns a copy of ``df`` with the columns named in ``dtypes`` cast to those dtypes, so the
+    result does not depend on the values, and raises ``ValueError`` if an integer column does not
+    fit its type. Other float columns become float32 and other integer columns the smallest
+    integer type that holds their values.
+    """
+    dtypes = dtypes or {}
+    converted = {}
+    for column in df.columns:
+        if column in dtypes:
+            dtype = np.dtype(dtypes[column])
+            if dtype.kind == "i" and len(df) and pd.api.types.is_integer_dtype(df[column]):
+                info = np.iinfo(dtype)
+                if df[column].min() < info.min or df[column].max() > info.max:
+                    raise ValueError(f"Column '{column}' has values outside the {dtype} range")
+            converted[column] = df[column].astype(dtype)
+        elif pd.api.types.is_float_dtype(df[column]):
+            converted[column] = df[column].astype(np.float32)
+        elif pd.api.types.is_integer_dtype(df[column]):
+            converted[column] = pd.to_numeric(df[column], downcast="integer")
+    return df.assign(**converted)
+
+
+def save_frame(data, path: str) -> str:
+    """
+    Write a DataFrame (or Series) as an intermediate artifact in the configured format and
+    return the path written. ``npy`` stores one structured array, so column names and
+    per-column dtypes survive and the file can be memory-mapped on load.
+    """
+    settings = artifact_settings()
+    df = data.to_frame() if isinstance(data, pd.Series) else data
+    target = artifact_path(path, settings["format"])
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+
+    if settings["format"] == "parquet":
+        df.to_parquet(target, index=False)
+    elif settings["format"] == "npy":
+        np.save(target, df.to_records(index=False), allow_pickle=False)
+    else:
+        df.to_csv(target, index=False)
+
+    logging.info(f"Saved {df.shape} artifact to {target}")
+    return target
+
+
+def load_frame(path: str) -> pd.DataFrame:
+    """Read an artifact written by ``save_frame``, memory-mapping it when ``artifacts.mmap`` is on."""
+    settings = artifact_settings()
+    source = artifact_path(path, settings["format"])
+
+    if settings["format"] == "parquet":
+        return pd.read_parquet(source, memory_map=settings["mmap"])
+    if settings["format"] == "npy":
+        records = np.load(source, mmap_mode="r" if settings["mmap"] else None, allow_pickle=False)
+        return pd.DataFrame({name: records[name] for name in records.dtype.names})
+    return pd.read_csv(source)
+
+
+class FrameAppender:
+    """
+    Writes an artifact one chunk at a time, for data that never fits in memory at once.
+    Every chunk must have the same columns and dtypes. ``npy`` needs its length up front,
+    so only ``csv`` and ``parquet`` can be appended to.
+    """
+
+    def __init__(self, path: str):
+        self.format = artifact_settings()["format"]
+        if self.format == "npy":
+            raise ValueError("Chunked artifacts can only be written as csv or parquet, set artifacts.format")
+        self.target = artifact_path(path, self.format)
+        self.rows = 0
+        self._parquet_writer = None
+        os.makedirs(os.path.dirname(self.target), exist_ok=True)
+
+    def append(self, data) -> None:
+        df = data.to_frame() if isinstance(data, pd.Series) else data
+        if self.format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.target, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            df.to_csv(self.target, mode="a" if self.rows else "w", header=not self.rows, index=False)
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        logging.info(f"Saved {self.rows} rows to {self.target}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ArtifactWriter:
+    """
+    Writes artifacts on background threads, so an in-process pipeline run can hand the frames
+    to the next stage while they are still being written.
+    ``flush()`` waits for every write, re-raises the first failure, then runs the callbacks
+    registered with ``after_flush`` (bookkeeping that needs the files on disk).
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-writer")
+        self._pending = {}
+        self._callbacks = []
+
+    def save(self, data, path: str) -> str:
+        target = artifact_path(path)
+        self._pending[target] = self._executor.submit(save_frame, data, path)
+        return target
+
+    def is_pending(self, paths) -> bool:
+        """True if any of ``paths`` may not be fully written yet."""
+        return any(path in self._pending for path in paths)
+
+    def after_flush(self, callback) -> None:
+        self._callbacks.append(callback)
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.result()
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            # On failure still let queued writes finish, so no half-written file is left behind
+            self._executor.shutdown(wait=True)
@@ -0,0 +1,170 @@
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+from src.config import CONFIG
+from src.logger import logging
+from src.exception import MyException
+from src.components.data_processing import add_date_features
+from src.components.s3_transfer import s3_client
+
+# Feature order used when the model artifact does not record its input columns
+FEATURE_COLUMNS = ["Open", "High", "Low", "Adj Close", "Volume", "year", "month", "day"]
+
+# Model of the current worker process, loaded once by the pool initializer
+_worker_model = None
+
+
+def _init_worker(model_path: str) -> None:
+    global _worker_model
+    _worker_model = joblib.load(model_path)
+
+
+def _score_chunk(chunk: pd.DataFrame, feature_columns: list) -> np.ndarray:
+    return _worker_model.predict(add_date_features(chunk)[feature_columns])
+
+
+def iter_chunks(path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Yield ``path`` (CSV or Parquet) as DataFrames of at most ``chunk_size`` rows."""
+    if path.endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+class PredictionWriter:
+    """Appends scored chunks to one CSV or Parquet file (one row group per chunk)."""
+
+    def __init__(self, path: str, output_format: str):
+        if output_format not in ("csv", "parquet"):
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.path = path
+        self.output_format = output_format
+        self.rows = 0
+        self._parquet_writer = None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.output_format == "csv":
+            df.to_csv(self.path, mode="w" if self.rows == 0 else "a", header=self.rows == 0, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            else:
+                # A chunk can infer a different type (e.g. an all-null column); keep the first schema
+                table = table.cast(self._parquet_writer.schema)
+            self._parquet_writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+class BatchScoring:
+    """
+    Scores large CSV/Parquet files offline with the model artifact ModelTraining produces.
+
+    The input is read in fixed-size chunks, each chunk gets the same Date -> year/month/day
+    features as training and is scored in a process pool. Only a bounded window of chunks is in
+    flight, and results are written in input order as they complete, so memory stays flat
+    regardless of the file size.
+    """
+
+    def __init__(self):
+        self.config = CONFIG["batch_scoring"]
+        logging.info("Batch scoring class initialized.")
+
+    def resolve_model(self, model_path: Optional[str] = None) -> str:
+        """Return a local model path, downloading the trained model from S3 if it is not on disk."""
+        try:
+            model_path = model_path or self.config["model"]
+            if os.path.exists(model_path):
+                return model_path
+
+            bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
+            aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
+            aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+            aws_region = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+
+            if not all([aws_access_key, aws_secret_key, bucket_name]):
+                raise ValueError(f"{model_path} not found and AWS credentials or bucket name missing "
+                                 "in environment variables.")
+
+            s3 = s3_client(aws_region)
+
+            os.makedirs(os.path.dirname(model_path), exist_ok=True)
+            s3.download_file(Bucket=bucket_name, Key=self.config["s3_model_key"], Filename=model_path)
+            logging.info(f"Downloaded s3://{bucket_name}/{self.config['s3_model_key']} to {model_path}")
+            return model_path
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def score_file(self, input_path: str, output_path: str, model_path: Optional[str] = None,
+                   chunk_size: Optional[int] = None, workers: Optional[int] = None,
+                   output_format: Optional[str] = None) -> int:
+        """
+        Score every row of ``input_path`` and write its columns plus ``prediction`` to ``output_path``.
+        Returns the number of rows scored.
+        """
+        try:
+            model_path = self.resolve_model(model_path)
+            chunk_size = chunk_size or self.config["chunk_size"]
+            workers = workers if workers is not None else self.config.get("workers") or os.cpu_count() or 1
+            if output_format is None:
+                output_format = "parquet" if output_path.endswith((".parquet", ".pq")) else "csv"
+
+            model = joblib.load(model_path)
+            feature_columns = list(getattr(model, "feature_names_in_", FEATURE_COLUMNS))
+            logging.info(f"Scoring {input_path} -> {output_path} ({output_format}) in chunks of {chunk_size} "
+                         f"rows with {workers} worker(s)")
+
+            writer = PredictionWriter(output_path, output_format)
+            start = time.perf_counter()
+            try:
+                if workers <= 1:
+                    for chunk in iter_chunks(input_path, chunk_size):
+                        features = add_date_features(chunk)[feature_columns]
+                        writer.write(chunk.assign(prediction=model.predict(features)))
+                else:
+                    del model
+                    self._score_in_pool(input_path, writer, model_path, feature_columns, chunk_size, workers)
+            finally:
+                writer.close()
+
+            elapsed = time.perf_counter() - start
+            logging.info(f"Scored {writer.rows} rows in {elapsed:.2f}s "
+                         f"({writer.rows / max(elapsed, 1e-9):.0f} rows/s), saved to {output_path}")
+            return writer.rows
+        except Exception as e:
+            logging.error("Error occurred in batch scoring", exc_info=True)
+            raise MyException(e, sys)
+
+    @staticmethod
+    def _score_in_pool(input_path: str, writer: PredictionWriter, model_path: str, feature_columns: list,
+                       chunk_size: int, workers: int) -> None:
+        # Two chunks per worker keep the pool busy while bounding what is held in memory
+        max_in_flight = 2 * workers
+        in_flight = deque()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(model_path,)) as pool:
+            for chunk in iter_chunks(input_path, chunk_size):
+                in_flight.append((chunk, pool.submit(_score_chunk, chunk, feature_columns)))
+                if len(in_flight) >= max_in_flight:
+                    done_chunk, future = in_flight.popleft()
+                    writer.write(done_chunk.assign(prediction=future.result()))
+            while in_flight:
+                done_chunk, future = in_flight.popleft()
+                writer.write(done_chunk.assign(prediction=future.result()))
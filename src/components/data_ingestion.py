@@ -1,12 +1,16 @@
 import pandas as pd
+import json
 import os
 import sys
-import boto3
+import time
+
+from boto3.s3.transfer import MB
 
 from pandas import DataFrame
 from src.logger import logging
 from src.exception import MyException
 from src.config import CONFIG
+from src.components.s3_transfer import s3_client, transfer_config
 
 
 class IngestData:
@@ -14,14 +18,17 @@ class IngestData:
     Data ingestion class which ingests data from AWS S3 and returns a DataFrame.
     """
 
-    def __init__(self):
-        """Initialize the data ingestion class."""
-        self.config = CONFIG["data_ingest"]
+    def __init__(self, config=None):
+        """Initialize the data ingestion class. ``config`` replaces the data_ingest section."""
+        self.config = config if config is not None else CONFIG["data_ingest"]
         logging.info("✅ IngestData class initialized with configuration.")
 
-    def export_data_from_s3(self) -> DataFrame:
+    def export_data_from_s3(self, load: bool = True) -> DataFrame:
         """
-        Export CSV data from AWS S3 and return it as a pandas DataFrame.
+        Export CSV data from AWS S3 and return it as a pandas DataFrame (None with ``load=False``).
+
+        The download is skipped when the local feature store copy has a sidecar manifest
+        (``<feature_store>.manifest.json``) whose ETag, size and last-modified time match the object.
         """
         try:
             logging.info("🚀 Starting export of data from AWS S3.")
@@ -43,18 +50,23 @@ class IngestData:
             logging.info(f"📄 S3 Key: {s3_key}")
             logging.info(f"📍 Destination path: {feature_store_file_path}")
 
-            # Initialize S3 client
-            s3 = boto3.client("s3",
-                            region_name=aws_region,
-                            aws_access_key_id=aws_access_key,
-                            aws_secret_access_key=aws_secret_key)
+            # Initialize S3 client (AWS_S3_ENDPOINT_URL points it at a local S3 stand-in)
+            s3 = s3_client(aws_region)
 
             # Ensure local directory exists
             os.makedirs(os.path.dirname(feature_store_file_path), exist_ok=True)
 
-            # Download file from S3
-            s3.download_file(Bucket=bucket_name, Key=s3_key, Filename=feature_store_file_path)
-            logging.info(f"✅ Downloaded S3 object to: {feature_store_file_path}")
+            # Download file from S3, unless the local copy is the same object version
+            remote = self._remote_manifest(s3, bucket_name, s3_key)
+            if self._is_unchanged(remote, feature_store_file_path):
+                logging.info(f"⏭️ Skipped download, {feature_store_file_path} matches "
+                             f"s3://{bucket_name}/{s3_key} (ETag {remote['etag']}, {remote['size']} bytes)")
+            else:
+                self._download(s3, bucket_name, s3_key, feature_store_file_path, remote)
+                logging.info(f"✅ Downloaded S3 object to: {feature_store_file_path}")
+
+            if not load:
+                return None
 
             # Load CSV into DataFrame
             dataframe = pd.read_csv(feature_store_file_path)
@@ -66,16 +78,81 @@ class IngestData:
             raise MyException(e, sys)
 
 
-    def initiate_data_ingestion(self) -> None:
+    @staticmethod
+    def _manifest_path(feature_store_file_path: str) -> str:
+        return feature_store_file_path + ".manifest.json"
+
+    @staticmethod
+    def _remote_manifest(s3, bucket_name: str, s3_key: str) -> dict:
+        """ETag, size and last-modified time of the S3 object, from a HEAD request."""
+        head = s3.head_object(Bucket=bucket_name, Key=s3_key)
+        return {
+            "bucket": bucket_name,
+            "key": s3_key,
+            "etag": head["ETag"].strip('"'),
+            "size": head["ContentLength"],
+            "last_modified": head["LastModified"].isoformat(),
+        }
+
+    def _is_unchanged(self, remote: dict, feature_store_file_path: str) -> bool:
+        """
+        True if the local copy was downloaded from the same object version as ``remote``.
+        The local file must still have the recorded size, so a truncated or edited copy is fetched again.
         """
-        Orchestrates the data ingestion step from S3.
+        manifest_path = self._manifest_path(feature_store_file_path)
+        if not os.path.exists(feature_store_file_path) or not os.path.exists(manifest_path):
+            return False
+        try:
+            with open(manifest_path) as f:
+                local = json.load(f)
+        except (OSError, ValueError):
+            logging.warning(f"⚠️ Ignoring unreadable manifest: {manifest_path}")
+            return False
+        return local == remote and os.path.getsize(feature_store_file_path) == remote["size"]
+
+    def _download(self, s3, bucket_name: str, s3_key: str, feature_store_file_path: str, remote: dict) -> None:
+        """
+        Download the object with concurrent ranged GETs, then record its manifest.
+        Writes to a temporary file first, so an interrupted download never leaves a partial copy in place.
+        """
+        config = transfer_config(self.config.get("transfer", {}))
+        # A stale manifest must not survive a failed download
+        manifest_path = self._manifest_path(feature_store_file_path)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+        tmp_path = f"{feature_store_file_path}.{os.getpid()}.tmp"
+        start = time.perf_counter()
+        try:
+            s3.download_file(Bucket=bucket_name, Key=s3_key, Filename=tmp_path, Config=config)
+            if os.path.getsize(tmp_path) != remote["size"]:
+                raise IOError(f"Object changed during download: expected {remote['size']} bytes, "
+                              f"got {os.path.getsize(tmp_path)}")
+            os.replace(tmp_path, feature_store_file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        elapsed = time.perf_counter() - start
+
+        with open(manifest_path, "w") as f:
+            json.dump(remote, f, indent=2)
+        logging.info(f"📥 Transferred {remote['size'] / MB:.1f} MB in {elapsed:.2f}s "
+                     f"({config.max_concurrency} threads, "
+                     f"{config.multipart_chunksize // MB} MB parts)")
+
+    def initiate_data_ingestion(self) -> DataFrame:
+        """
+        Orchestrates the data ingestion step from S3 and returns the ingested DataFrame.
         """
         logging.info("🏁 Starting data ingestion process...")
 
         try:
-            self.export_data_from_s3()
+            # Feature stores preprocessed in chunks may not fit in memory, so they're only downloaded
+            streaming = self.config.get("streaming", {}).get("enabled", False)
+            dataframe = self.export_data_from_s3(load=not streaming)
             logging.info("🎉 Data ingestion from S3 completed successfully.")
             logging.info("🏁 Exiting initiate_data_ingestion method.")
+            return dataframe
 
         except Exception as e:
             logging.error("❌ Data ingestion failed due to an error.")
@@ -1,21 +1,52 @@
 import os
 import sys
+import joblib
 import numpy as np
 import pandas as pd
 from src.config import CONFIG
 from src.logger import logging
 from src.exception import MyException
+from contextlib import ExitStack
+from src.components.artifacts import FrameAppender, artifact_settings, downcast_frame, save_frame
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 
+# Artifact dtypes when artifacts.downcast is on. Fixed rather than inferred from the values, so
+# in-memory and chunked preprocessing (where every chunk must match) write the same dtypes
+ARTIFACT_DTYPES = {"Open": np.float32, "High": np.float32, "Low": np.float32, "Close": np.float32,
+                   "Adj Close": np.float32, "Volume": np.int32, "year": np.int16, "month": np.int8, "day": np.int8}
+
+def is_test_row(row_numbers: np.ndarray, test_size: float) -> np.ndarray:
+    """
+    Deterministic train/test assignment of rows by their position in the file. Each row number
+    is hashed, so the split does not depend on the chunk size and needs no state between chunks.
+    """
+    buckets = pd.util.hash_array(row_numbers.astype(np.int64)) % 10_000
+    return buckets < int(test_size * 10_000)
+
+
+def add_date_features(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of ``df`` with its ``Date`` column replaced by ``year``, ``month`` and ``day``.
+    Parsing is vectorized and cached, so repeated dates in large files are parsed once.
+    """
+    dates = pd.to_datetime(df['Date'], cache=True)
+    return df.drop(columns='Date').assign(year=dates.dt.year, month=dates.dt.month, day=dates.dt.day)
+
+
 class DataPreprocess:
     """
     Data preprocessing strategy which preprocesses the data.
     """
 
-    def __init__(self):
-        """Initialize the data ingestion class."""
-        self.config = CONFIG["data_ingest"]
+    def __init__(self, writer=None, config=None):
+        """
+        Initialize the data ingestion class. With an ``ArtifactWriter``, artifacts are written
+        in the background instead of before each method returns. ``config`` replaces the
+        data_ingest section.
+        """
+        self.config = config if config is not None else CONFIG["data_ingest"]
+        self.save = writer.save if writer is not None else save_frame
         self.df = None
         logging.info("Data Processing class initialized.")
 
@@ -30,15 +61,11 @@ class DataPreprocess:
             logging.info(f"Dataset shape before processing: {df.shape}")
             logging.info(f"Dataset Info before processing: {df.info()}")
 
-            df['Date'] = pd.to_datetime(df['Date'])
-            df['year'] = df['Date'].dt.year
-            df['month'] = df['Date'].dt.month
-            df['day'] = df['Date'].dt.day
-
-            df.drop('Date',axis=1,inplace=True)
-            save_path = self.config["processed_data_path"]
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            df.to_csv(save_path, index=False)
+            df = add_date_features(df)
+            if artifact_settings()["downcast"]:
+                df = downcast_frame(df, ARTIFACT_DTYPES)
+                logging.info(f"Downcast dtypes: {df.dtypes.astype(str).to_dict()}")
+            save_path = self.save(df, self.config["processed_data_path"])
             logging.info(f"Successfully saved processed data to {save_path}")
 
             self.df = df
@@ -49,10 +76,11 @@ class DataPreprocess:
             logging.error("Error occurred in Processing data", exc_info=True)
             raise MyException(e, sys)
         
-    def split_data_as_train_test(self) -> None:
+    def split_data_as_train_test(self) -> dict:
         """
         Method Name :   split_data_as_train_test
         Description :   This method splits the dataframe into train set and test set based on split ratio 
+        Output      :   The splits as written to disk: X_train, X_test, y_train, y_test
         
         On Failure  :   Write an exception log and then raise an exception
         """
@@ -68,22 +96,78 @@ class DataPreprocess:
             logging.info("Performed train test split on the dataframe")
             logging.info("Exited split_data_as_train_test method of Data_Ingestion class")
 
-            sclr = StandardScaler()
+            # Only fitted here: the splits are saved unscaled, and training ships the scaler in its
+            # Pipeline, which scales the features itself
+            sclr = StandardScaler().fit(train_set)
 
-            X_train = sclr.fit_transform(train_set)
-            X_test = sclr.transform(test_set)
+            # Persist the fitted scaler so training can ship it alongside the model
+            scaler_path = self.config["scaler"]
+            os.makedirs(os.path.dirname(scaler_path), exist_ok=True)
+            joblib.dump(sclr, scaler_path)
+            logging.info(f"Saved fitted scaler to {scaler_path}")
 
             dir_path = os.path.dirname(self.config["feature_store"])
             os.makedirs(dir_path,exist_ok=True)
             
             logging.info(f"Exporting train and test file path.")
-            os.makedirs(os.path.dirname(self.config["TRAIN_FILE_NAME"]), exist_ok=True)
-            pd.DataFrame(train_set).to_csv(self.config["TRAIN_FILE_NAME"], index=False)
-            pd.DataFrame(test_set).to_csv(self.config["TEST_FILE_NAME"], index=False, header=True)
-            pd.DataFrame(y_train).to_csv(self.config["TRAIN_LABEL_FILE_NAME"], index=False)
-            pd.DataFrame(y_test).to_csv(self.config["TEST_LABEL_FILE_NAME"], index=False)
+            # Labels as one-column frames, the shape they have when read back from disk
+            splits = {"X_train": train_set, "X_test": test_set,
+                      "y_train": y_train.to_frame(), "y_test": y_test.to_frame()}
+            self.save(splits["X_train"], self.config["TRAIN_FILE_NAME"])
+            self.save(splits["X_test"], self.config["TEST_FILE_NAME"])
+            self.save(splits["y_train"], self.config["TRAIN_LABEL_FILE_NAME"])
+            self.save(splits["y_test"], self.config["TEST_LABEL_FILE_NAME"])
 
             logging.info(f"Exported train and test file path.")
+            return splits
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def process_in_chunks(self, chunk_size: int, test_size: float = 0.25) -> None:
+        """
+        Method Name :   process_in_chunks
+        Description :   Out-of-core version of handle_data + split_data_as_train_test. Reads the
+                        feature store ``chunk_size`` rows at a time, derives the date features,
+                        assigns rows to train or test by ``is_test_row``, appends each part to its
+                        artifact and fits the scaler on the train rows with ``partial_fit``. Peak
+                        memory is a few chunks, whatever the size of the file.
+
+        On Failure  :   Write an exception log and then raise an exception
+        """
+        logging.info(f"Entered process_in_chunks method of Data_Ingestion class ({chunk_size} rows per chunk)")
+
+        try:
+            downcast = artifact_settings()["downcast"]
+            sclr = StandardScaler()
+            outputs = ("processed_data_path", "TRAIN_FILE_NAME", "TEST_FILE_NAME",
+                       "TRAIN_LABEL_FILE_NAME", "TEST_LABEL_FILE_NAME")
+
+            with ExitStack() as stack:
+                writers = {name: stack.enter_context(FrameAppender(self.config[name])) for name in outputs}
+                rows = 0
+                for chunk in pd.read_csv(self.config["feature_store"], chunksize=chunk_size):
+                    chunk = add_date_features(chunk)
+                    if downcast:
+                        chunk = downcast_frame(chunk, ARTIFACT_DTYPES)
+                    test = is_test_row(np.arange(rows, rows + len(chunk)), test_size)
+                    rows += len(chunk)
+
+                    X = chunk.drop(columns='Close')
+                    y = chunk[['Close']]
+                    writers["processed_data_path"].append(chunk)
+                    writers["TRAIN_FILE_NAME"].append(X[~test])
+                    writers["TEST_FILE_NAME"].append(X[test])
+                    writers["TRAIN_LABEL_FILE_NAME"].append(y[~test])
+                    writers["TEST_LABEL_FILE_NAME"].append(y[test])
+                    if (~test).any():
+                        sclr.partial_fit(X[~test])
+
+            logging.info(f"Processed {rows} rows: {writers['TRAIN_FILE_NAME'].rows} train, "
+                         f"{writers['TEST_FILE_NAME'].rows} test")
+
+            scaler_path = self.config["scaler"]
+            os.makedirs(os.path.dirname(scaler_path), exist_ok=True)
+            joblib.dump(sclr, scaler_path)
+            logging.info(f"Saved fitted scaler to {scaler_path}")
         except Exception as e:
             raise MyException(e, sys)
-        
\ No newline at end of file
@@ -1,12 +1,16 @@
 import os
 import sys
+import time
+import fnmatch
 import zipfile
 import gdown
-import boto3
+from boto3.s3.transfer import MB
+from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from src.logger import logging
 from src.exception import MyException
 from src.config import CONFIG
+from src.components.s3_transfer import BulkUploader, s3_client, transfer_config
 
 load_dotenv()
 
@@ -73,16 +77,15 @@ class UploadData:
             if not os.path.exists(local_csv_path):
                 raise FileNotFoundError(f"NFLX.csv not found at path: {local_csv_path}")
 
-            s3 = boto3.client("s3",
-                            region_name=aws_region,
-                            aws_access_key_id=aws_access_key,
-                            aws_secret_access_key=aws_secret_key)
+            s3 = s3_client(aws_region)
 
             filename = os.path.basename(local_csv_path)
             s3_key = os.path.join(s3_upload_prefix, filename).replace("\\", "/")
 
-            s3.upload_file(local_csv_path, bucket_name, s3_key)
-            logging.info(f"Uploaded {local_csv_path} to s3://{bucket_name}/{s3_key}")
+            # Skipped when the object already holds the same content
+            stats = BulkUploader(s3, bucket_name).upload({local_csv_path: s3_key})
+            action = "Uploaded" if stats["uploaded"] else "Skipped unchanged"
+            logging.info(f"{action} {local_csv_path} -> s3://{bucket_name}/{s3_key}")
 
             return s3_key
 
@@ -90,3 +93,182 @@ class UploadData:
             logging.error("Error occurred while uploading NFLX.csv to AWS S3", exc_info=True)
             raise MyException(e, sys)
 
+    def ticker_members(self) -> dict:
+        """
+        Map each ticker symbol in the downloaded ZIP to its member name, e.g. {"NFLX": "stocks/NFLX.csv"}.
+        """
+        try:
+            with zipfile.ZipFile(self.config["local_data_file"], 'r') as zip_ref:
+                members = [name for name in zip_ref.namelist()
+                           if name.lower().endswith(".csv") and not os.path.basename(name).startswith(".")]
+
+            tickers = {os.path.splitext(os.path.basename(name))[0].upper(): name for name in members}
+            logging.info(f"Found {len(tickers)} ticker files in {self.config['local_data_file']}")
+            return tickers
+        except Exception as e:
+            logging.error("Error occurred while listing ticker files", exc_info=True)
+            raise MyException(e, sys)
+
+    def discover_tickers(self) -> dict:
+        """
+        Map each ticker symbol in the downloaded ZIP to its extracted CSV, e.g. {"NFLX": "artifacts/NFLX.csv"}.
+        """
+        unzip_path = self.config["unzip_dir"]
+        return {symbol: os.path.join(unzip_path, name) for symbol, name in self.ticker_members().items()}
+
+    def upload_tickers(self, tickers: dict, s3_prefix: str) -> dict:
+        """
+        Upload every ticker CSV to ``<s3_prefix>/<SYMBOL>.csv`` in one concurrent bulk upload,
+        skipping files that are already in the bucket unchanged. Returns the S3 key of each symbol.
+        """
+        try:
+            bucket_name, s3 = self._s3_client()
+            s3_keys = {symbol: f"{s3_prefix}/{symbol}.csv" for symbol in tickers}
+            stats = BulkUploader(s3, bucket_name).upload({tickers[symbol]: s3_keys[symbol] for symbol in tickers})
+
+            logging.info(f"Synced {len(tickers)} ticker files to s3://{bucket_name}/{s3_prefix}/ "
+                         f"({stats['uploaded']} uploaded, {stats['skipped']} unchanged)")
+            return s3_keys
+
+        except Exception as e:
+            logging.error("Error occurred while uploading ticker files to AWS S3", exc_info=True)
+            raise MyException(e, sys)
+
+    def stream_members_to_s3(self, members: dict) -> dict:
+        """
+        Upload ZIP members (member name -> S3 key) straight from the archive, without extracting
+        them. Each member is decompressed part by part into a multipart upload, so memory use is
+        bounded by the part size and concurrency in ``s3_upload``. A member is skipped when the
+        object's metadata already records the same CRC-32 and size, read from the ZIP directory.
+        """
+        try:
+            bucket_name, s3 = self._s3_client()
+            config = transfer_config(CONFIG.get("s3_upload", {}))
+            stats = {"uploaded": 0, "skipped": 0, "bytes_uploaded": 0, "bytes_skipped": 0}
+            start = time.perf_counter()
+
+            with zipfile.ZipFile(self.config["local_data_file"], 'r') as zip_ref:
+                for name, s3_key in members.items():
+                    info = zip_ref.getinfo(name)
+                    metadata = {"zip-crc32": f"{info.CRC:08x}", "size": str(info.file_size)}
+                    if self._object_metadata(s3, bucket_name, s3_key) == metadata:
+                        stats["skipped"] += 1
+                        stats["bytes_skipped"] += info.file_size
+                        continue
+                    with zip_ref.open(info) as member:
+                        s3.upload_fileobj(_StreamReader(member), bucket_name, s3_key,
+                                          ExtraArgs={"Metadata": metadata}, Config=config)
+                    stats["uploaded"] += 1
+                    stats["bytes_uploaded"] += info.file_size
+                    logging.info(f"Streamed {name} ({info.file_size / MB:.1f} MB uncompressed) "
+                                 f"to s3://{bucket_name}/{s3_key}")
+
+            stats["seconds"] = round(time.perf_counter() - start, 3)
+            logging.info(f"📤 Streamed {stats['uploaded']} member(s) ({stats['bytes_uploaded'] / MB:.1f} MB), "
+                         f"skipped {stats['skipped']} unchanged ({stats['bytes_skipped'] / MB:.1f} MB) "
+                         f"in {stats['seconds']:.2f}s")
+            return stats
+        except Exception as e:
+            logging.error("Error occurred while streaming zip members to AWS S3", exc_info=True)
+            raise MyException(e, sys)
+
+    def convert_members_to_parquet(self, members: list, output_dir: str) -> list:
+        """
+        Convert CSV members of the ZIP to ``<output_dir>/<name>.parquet`` straight from the archive.
+        The CSV is parsed block by block and each block written as a row group, so memory use is
+        bounded by the block size. The member's CRC-32 is kept in the Parquet metadata, and an
+        existing file converted from the same member is left as it is. Returns the Parquet paths.
+        """
+        try:
+            import pyarrow.csv as pv
+            import pyarrow.parquet as pq
+
+            os.makedirs(output_dir, exist_ok=True)
+            paths = []
+            with zipfile.ZipFile(self.config["local_data_file"], 'r') as zip_ref:
+                for name in members:
+                    path = os.path.join(output_dir, os.path.splitext(os.path.basename(name))[0] + ".parquet")
+                    info = zip_ref.getinfo(name)
+                    source = {b"zip-crc32": f"{info.CRC:08x}".encode(), b"size": str(info.file_size).encode()}
+                    paths.append(path)
+                    if os.path.exists(path) and (pq.read_schema(path).metadata or {}).items() >= source.items():
+                        logging.info(f"Skipped converting {name}, {path} is up to date")
+                        continue
+
+                    read_options = pv.ReadOptions(block_size=self.config["stream"].get("block_size_mb", 4) * MB)
+                    tmp_path = f"{path}.{os.getpid()}.tmp"
+                    with zip_ref.open(info) as member, \
+                            pv.open_csv(_StreamReader(member), read_options=read_options) as reader:
+                        schema = reader.schema.with_metadata(source)
+                        with pq.ParquetWriter(tmp_path, schema) as writer:
+                            for batch in reader:
+                                writer.write_batch(batch)
+                    os.replace(tmp_path, path)
+                    logging.info(f"Converted {name} to {path}")
+            return paths
+        except Exception as e:
+            logging.error("Error occurred while converting zip members to Parquet", exc_info=True)
+            raise MyException(e, sys)
+
+    def stream_upload(self) -> str:
+        """
+        Streaming replacement for extract_zip_file + upload_to_s3: the members matching
+        ``stream.members`` go from the ZIP to S3 (and to Parquet under ``stream.columnar_dir``,
+        if set) without an uncompressed copy on disk. Returns the S3 key of ``nflx_csv_path``.
+        """
+        try:
+            stream = self.config["stream"]
+            s3_upload_prefix = self.config.get("s3_upload_prefix", "uploaded_data")
+            with zipfile.ZipFile(self.config["local_data_file"], 'r') as zip_ref:
+                names = zip_ref.namelist()
+            patterns = stream.get("members") or [os.path.basename(self.config["nflx_csv_path"])]
+            selected = [name for name in names
+                        if any(fnmatch.fnmatch(os.path.basename(name), pattern) for pattern in patterns)]
+            if not selected:
+                raise FileNotFoundError(f"No member of {self.config['local_data_file']} matches {patterns}")
+
+            members = {name: f"{s3_upload_prefix}/{os.path.basename(name)}" for name in selected}
+            self.stream_members_to_s3(members)
+            if stream.get("columnar_dir"):
+                self.convert_members_to_parquet(selected, stream["columnar_dir"])
+            return f"{s3_upload_prefix}/{os.path.basename(self.config['nflx_csv_path'])}"
+        except MyException:
+            raise
+        except Exception as e:
+            logging.error("Error occurred while streaming the dataset to AWS S3", exc_info=True)
+            raise MyException(e, sys)
+
+    @staticmethod
+    def _object_metadata(s3, bucket_name: str, s3_key: str) -> dict:
+        try:
+            return s3.head_object(Bucket=bucket_name, Key=s3_key).get("Metadata", {})
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return {}
+            raise
+
+    @staticmethod
+    def _s3_client() -> tuple:
+        bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
+        aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
+        aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+        aws_region = os.getenv("AWS_DEFAULT_REGION")
+
+        if not aws_access_key or not aws_secret_key or not bucket_name:
+            raise ValueError("AWS credentials or bucket name not found in environment variables")
+
+        return bucket_name, s3_client(aws_region)
+
+
+class _StreamReader:
+    """
+    Read-only view of a ZIP member. Without ``seek``, s3transfer and pyarrow read it front to
+    back in parts; seeking a compressed member would decompress it again from the start.
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.closed = False
+
+    def read(self, size: int = -1) -> bytes:
+        return self._fileobj.read(size)
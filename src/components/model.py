@@ -1,37 +1,46 @@
 import os
 import sys
-import boto3
 import joblib
 import pandas as pd
 from src.config import CONFIG
 from src.logger import logging
 from src.exception import MyException
+from src.components.s3_transfer import BulkUploader, s3_client
 from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
 from sklearn.metrics import r2_score,mean_squared_error
 
 class ModelTraining:
 
-    def __init__(self):
-        """Initialize the data ingestion class."""
-        self.config = CONFIG["model_training"]
+    def __init__(self, config=None):
+        """Initialize the data ingestion class. ``config`` replaces the model_training section."""
+        self.config = config if config is not None else CONFIG["model_training"]
+        self.metrics = {}
         logging.info("Model training class initialized.")
 
     def handle_training(self, X_train, X_test, y_train, y_test) -> None:
 
         try:
-            # Train the model
+            # Reuse the scaler fitted during preprocessing
+            sclr = joblib.load(self.config["scaler"])
+
+            # Train the model on the scaled features
             lr = LinearRegression()
-            lr.fit(X_train, y_train)
-            y_pred = lr.predict(X_test)
+            lr.fit(sclr.transform(X_train), y_train)
+
+            # Bundle scaler and regressor so serving only calls predict on raw features
+            model = Pipeline(steps=[("scaler", sclr), ("model", lr)])
+            y_pred = model.predict(X_test)
 
             r2 = r2_score(y_test, y_pred)
             mse = mean_squared_error(y_test, y_pred)
             logging.info(f"Model evaluation: R2={r2}, MSE={mse}")
+            self.metrics = {"r2": r2, "mse": mse}
 
             # Save model locally (temporary)
             local_model_path = self.config["model"]
-            os.makedirs("artifacts/trained_model", exist_ok=True)
-            joblib.dump(lr, open(local_model_path, "wb"))
+            os.makedirs(os.path.dirname(local_model_path), exist_ok=True)
+            joblib.dump(model, open(local_model_path, "wb"))
 
             # AWS details
             bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
@@ -45,20 +54,16 @@ class ModelTraining:
                 raise ValueError("AWS credentials or bucket name not found in environment variables")
 
             # Initialize S3 client
-            s3 = boto3.client(
-                "s3",
-                region_name=aws_region,
-                aws_access_key_id=aws_access_key,
-                aws_secret_access_key=aws_secret_key
-            )
+            s3 = s3_client(aws_region)
 
             # Define S3 path
             filename = os.path.basename(local_model_path)
             s3_key = os.path.join(s3_upload_prefix, filename).replace("\\", "/")
 
-            # Upload model to S3
-            s3.upload_file(local_model_path, bucket_name, s3_key)
-            logging.info(f"Uploaded model to s3://{bucket_name}/{s3_key}")
+            # Upload model to S3, unless an identical artifact is already there
+            stats = BulkUploader(s3, bucket_name).upload({local_model_path: s3_key})
+            action = "Uploaded" if stats["uploaded"] else "Skipped unchanged"
+            logging.info(f"{action} model -> s3://{bucket_name}/{s3_key}")
 
             # Optionally remove local copy
             if os.path.exists(local_model_path):
@@ -0,0 +1,151 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional
+
+import pandas as pd
+from src.config import CONFIG
+from src.logger import logging
+from src.exception import MyException
+from src.components.data_upload import UploadData
+from src.components.data_ingestion import IngestData
+from src.components.data_processing import DataPreprocess
+from src.components.model import ModelTraining
+from src.components.s3_transfer import s3_client
+
+# Columns of the per-ticker summary table
+SUMMARY_COLUMNS = ["symbol", "rows", "r2", "mse", "seconds", "model", "error"]
+
+
+def ticker_config(section, symbol: str, artifacts_dir: str, **overrides) -> dict:
+    """Copy of a config section with every ``artifacts/...`` path moved under ``<artifacts_dir>/<symbol>/``."""
+    config = dict(section)
+    for key, value in section.items():
+        if isinstance(value, str) and value.startswith("artifacts/"):
+            config[key] = os.path.join(artifacts_dir, symbol, value[len("artifacts/"):])
+    config.update(overrides)
+    return config
+
+
+def _init_worker() -> None:
+    # One BLAS thread per process: the pool already uses every core
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(1)
+
+
+def _train_ticker(symbol: str, settings: dict) -> dict:
+    """Ingest, preprocess and train one ticker; returns its summary row instead of raising."""
+    start = time.perf_counter()
+    row = dict.fromkeys(SUMMARY_COLUMNS, None)
+    row.update(symbol=symbol, rows=0)
+    try:
+        data_config = ticker_config(CONFIG["data_ingest"], symbol, settings["artifacts_dir"],
+                                    s3_data=f"{settings['s3_prefix']}/{symbol}.csv")
+        model_config = ticker_config(CONFIG["model_training"], symbol, settings["artifacts_dir"],
+                                     s3_upload_prefix=f"{settings['s3_model_prefix']}/{symbol}")
+
+        data = IngestData(config=data_config).export_data_from_s3()
+        preprocess = DataPreprocess(config=data_config)
+        preprocess.handle_data(data)
+        splits = preprocess.split_data_as_train_test()
+
+        trainer = ModelTraining(config=model_config)
+        row["model"] = trainer.handle_training(splits["X_train"], splits["X_test"], splits["y_train"], splits["y_test"])
+        row.update(rows=len(data), **trainer.metrics)
+    except Exception as e:
+        row["error"] = str(e)
+    row["seconds"] = round(time.perf_counter() - start, 3)
+    return row
+
+
+class MultiTickerTraining:
+    """
+    Trains one model per ticker symbol in the downloaded dataset.
+
+    Every CSV in the ZIP is uploaded to ``tickers.s3_prefix``; each symbol is then ingested,
+    preprocessed and trained by the usual components in its own pool process, with its
+    artifacts under ``tickers.artifacts_dir/<SYMBOL>/`` and its model uploaded to
+    ``tickers.s3_model_prefix/<SYMBOL>/model.pkl``. A failing symbol is reported in the
+    summary table instead of stopping the others.
+    """
+
+    def __init__(self):
+        self.config = CONFIG["tickers"]
+        logging.info("Multi-ticker training class initialized.")
+
+    def upload(self) -> List[str]:
+        """Download and extract the dataset, then upload every ticker file. Returns the symbols."""
+        upload = UploadData()
+        upload.download_file()
+        if upload.config.get("stream", {}).get("enabled", False):
+            tickers = upload.ticker_members()
+            upload.stream_members_to_s3({name: f"{self.config['s3_prefix']}/{symbol}.csv"
+                                         for symbol, name in tickers.items()})
+        else:
+            upload.extract_zip_file()
+            tickers = upload.discover_tickers()
+            upload.upload_tickers(tickers, self.config["s3_prefix"])
+        return sorted(tickers)
+
+    def list_tickers(self) -> List[str]:
+        """Symbols already uploaded under ``tickers.s3_prefix``."""
+        try:
+            s3 = s3_client()
+            prefix = self.config["s3_prefix"].rstrip("/") + "/"
+            symbols = []
+            for page in s3.get_paginator("list_objects_v2").paginate(Bucket=os.getenv("AWS_S3_BUCKET_NAME"),
+                                                                     Prefix=prefix):
+                for item in page.get("Contents", []):
+                    name = item["Key"][len(prefix):]
+                    if name.endswith(".csv") and "/" not in name:
+                        symbols.append(name[:-len(".csv")])
+            return sorted(symbols)
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def train_all(self, symbols: List[str], workers: Optional[int] = None) -> pd.DataFrame:
+        """Train every symbol across ``workers`` processes and return the summary table."""
+        try:
+            if not symbols:
+                logging.info("No tickers to train")
+                return pd.DataFrame(columns=SUMMARY_COLUMNS)
+
+            workers = workers or self.config.get("workers") or os.cpu_count() or 1
+            workers = min(workers, len(symbols))
+            settings = {key: self.config[key] for key in ("s3_prefix", "s3_model_prefix", "artifacts_dir")}
+            logging.info(f"Training {len(symbols)} tickers with {workers} worker process(es)")
+
+            start = time.perf_counter()
+            rows = []
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = [pool.submit(_train_ticker, symbol, settings) for symbol in symbols]
+                for future in as_completed(futures):
+                    row = future.result()
+                    rows.append(row)
+                    status = f"R2={row['r2']:.4f}" if row["error"] is None else f"failed: {row['error']}"
+                    logging.info(f"[{len(rows)}/{len(symbols)}] {row['symbol']} {status} in {row['seconds']}s")
+            elapsed = time.perf_counter() - start
+
+            summary = pd.DataFrame(rows).sort_values("symbol").reset_index(drop=True)
+            summary_path = self.config["summary"]
+            os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+            summary.to_csv(summary_path, index=False)
+
+            failed = int(summary["error"].notna().sum())
+            logging.info(f"Trained {len(symbols) - failed}/{len(symbols)} tickers in {elapsed:.1f}s "
+                         f"(sum of per-ticker time {summary['seconds'].sum():.1f}s), summary saved to "
+                         f"{summary_path}\n{summary.drop(columns=['model']).to_string(index=False)}")
+            return summary
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def run(self, symbols: Optional[List[str]] = None, workers: Optional[int] = None,
+            upload: bool = True) -> pd.DataFrame:
+        available = self.upload() if upload else self.list_tickers()
+        if symbols:
+            missing = sorted(set(symbols) - set(available))
+            if missing:
+                raise MyException(ValueError(f"Tickers not found: {', '.join(missing)}"), sys)
+            available = sorted(symbols)
+        return self.train_all(available, workers)
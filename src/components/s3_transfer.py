@@ -0,0 +1,119 @@
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from boto3.s3.transfer import TransferConfig, MB, create_transfer_manager
+from botocore.exceptions import ClientError
+from src.config import CONFIG
+from src.logger import logging
+from src.exception import MyException
+
+# Object metadata key holding the SHA-256 of the uploaded file
+SHA256_METADATA_KEY = "sha256"
+
+
+def s3_client(region_name: str = None):
+    """
+    S3 client built from the AWS_* environment variables. AWS_S3_ENDPOINT_URL, when set,
+    points it at a local S3 stand-in instead of AWS.
+    """
+    return boto3.client("s3",
+                        region_name=region_name or os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
+                        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                        endpoint_url=os.getenv("AWS_S3_ENDPOINT_URL") or None)
+
+
+def transfer_config(settings) -> TransferConfig:
+    """TransferConfig from a config.yaml section with multipart_threshold_mb, multipart_chunksize_mb and max_concurrency."""
+    return TransferConfig(
+        multipart_threshold=int(settings.get("multipart_threshold_mb", 16) * MB),
+        multipart_chunksize=int(settings.get("multipart_chunksize_mb", 8) * MB),
+        max_concurrency=int(settings.get("max_concurrency", 10)),
+        use_threads=True,
+    )
+
+
+def file_checksums(path: str, config: TransferConfig) -> tuple:
+    """
+    SHA-256 of the file, and the ETag S3 gives it when uploaded with ``config``: the MD5 below
+    the multipart threshold, otherwise the MD5 of the part MD5s followed by ``-<parts>``.
+    """
+    sha256, md5 = hashlib.sha256(), hashlib.md5()
+    part_md5s = []
+    with open(path, "rb") as f:
+        for part in iter(lambda: f.read(config.multipart_chunksize), b""):
+            sha256.update(part)
+            md5.update(part)
+            part_md5s.append(hashlib.md5(part).digest())
+    if os.path.getsize(path) < config.multipart_threshold:
+        return sha256.hexdigest(), md5.hexdigest()
+    return sha256.hexdigest(), f"{hashlib.md5(b''.join(part_md5s)).hexdigest()}-{len(part_md5s)}"
+
+
+class BulkUploader:
+    """
+    Uploads many files at once through one shared transfer manager.
+
+    Each file is hashed and compared with the object already in the bucket (the SHA-256 stored
+    in its metadata by an earlier upload, or failing that its ETag). Unchanged files are
+    skipped; the rest are uploaded concurrently as multipart uploads, tuned by the
+    ``s3_upload`` section of config.yaml.
+    """
+
+    def __init__(self, s3, bucket_name: str, settings=None):
+        self.s3 = s3
+        self.bucket_name = bucket_name
+        self.config = transfer_config(settings if settings is not None else CONFIG.get("s3_upload", {}))
+
+    def _is_unchanged(self, path: str, key: str) -> tuple:
+        sha256, etag = file_checksums(path, self.config)
+        try:
+            head = self.s3.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False, sha256
+            raise
+        remote_sha256 = head.get("Metadata", {}).get(SHA256_METADATA_KEY)
+        if remote_sha256 is not None:
+            return remote_sha256 == sha256, sha256
+        return head["ETag"].strip('"') == etag, sha256
+
+    def upload(self, files: dict) -> dict:
+        """
+        Upload ``files`` (local path -> S3 key), skipping objects that already hold the same content.
+        Returns counts and bytes of the uploaded and skipped files.
+        """
+        try:
+            start = time.perf_counter()
+            stats = {"uploaded": 0, "skipped": 0, "bytes_uploaded": 0, "bytes_skipped": 0}
+
+            # Hash and HEAD every file concurrently; both mostly wait on disk or network
+            with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as pool:
+                checks = dict(zip(files, pool.map(lambda path: self._is_unchanged(path, files[path]), files)))
+
+            with create_transfer_manager(self.s3, self.config) as manager:
+                futures = []
+                for path, (unchanged, sha256) in checks.items():
+                    size = os.path.getsize(path)
+                    if unchanged:
+                        stats["skipped"] += 1
+                        stats["bytes_skipped"] += size
+                        continue
+                    futures.append(manager.upload(path, self.bucket_name, files[path],
+                                                  extra_args={"Metadata": {SHA256_METADATA_KEY: sha256}}))
+                    stats["uploaded"] += 1
+                    stats["bytes_uploaded"] += size
+                for future in futures:
+                    future.result()
+
+            stats["seconds"] = round(time.perf_counter() - start, 3)
+            logging.info(f"📤 Uploaded {stats['uploaded']} file(s) ({stats['bytes_uploaded'] / MB:.1f} MB), "
+                         f"skipped {stats['skipped']} unchanged ({stats['bytes_skipped'] / MB:.1f} MB) "
+                         f"to s3://{self.bucket_name} in {stats['seconds']:.2f}s")
+            return stats
+        except Exception as e:
+            raise MyException(e, sys)
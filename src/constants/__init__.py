@@ -29,3 +29,21 @@ Data PrePrecessing related constant
 ---------------------------------------------------------------
 """
 PRE_PROCESSING_STAGE_NAME = "Data Pre-Processing"
+"""
+---------------------------------------------------------------
+Model training related constant 
+---------------------------------------------------------------
+"""
+MODEL_TRAINING_STAGE_NAME = "Model training"
+"""
+---------------------------------------------------------------
+Batch scoring related constant 
+---------------------------------------------------------------
+"""
+BATCH_SCORING_STAGE_NAME = "Batch Scoring"
+"""
+---------------------------------------------------------------
+Multi-ticker training related constant 
+---------------------------------------------------------------
+"""
+MULTI_TICKER_STAGE_NAME = "Multi-Ticker Training"
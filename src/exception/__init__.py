@@ -12,11 +12,16 @@ def error_message_detail(error: Exception, error_detail: sys) -> str:
     # Extract traceback details (exception information)
     _, _, exc_tb = error_detail.exc_info()
 
-    # Get the file name where the exception occurred
-    file_name = exc_tb.tb_frame.f_code.co_filename
+    if exc_tb is not None:
+        # Get the file name where the exception occurred
+        file_name = exc_tb.tb_frame.f_code.co_filename
+        line_number = exc_tb.tb_lineno
+    else:
+        # Raised outside an except block: report the caller that built the exception instead
+        caller = error_detail._getframe(2)
+        file_name, line_number = caller.f_code.co_filename, caller.f_lineno
 
     # Create a formatted error message string with file name, line number, and the actual error
-    line_number = exc_tb.tb_lineno
     error_message = f"Error occurred in python script: [{file_name}] at line number [{line_number}]: {str(error)}"
     
     # Log the error for better tracking
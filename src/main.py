@@ -1,44 +1,56 @@
+import argparse
 import sys
 from src.constants import *
 from src.logger import logging
 from src.exception import MyException
+from src.components.artifacts import ArtifactWriter
 from src.pipeline.stage01_data_upload import DataUploadPipeline
 from src.pipeline.stage02_data_ingestion import DataIngestionPipeline
 from src.pipeline.stage03_data_processing import DataProcessingPipeline
 from src.pipeline.stage04_model_training import ModelPipeline
+from src.pipeline.stage_cache import StageCache, run_stage
 
-try:
-    logging.info(f">>>>>> stage {DATA_UPLOAD_STAGE_NAME} started <<<<<<")
-    data_ingestion = DataUploadPipeline()
-    data_ingestion.main()
-    logging.info(f">>>>>> stage {DATA_UPLOAD_STAGE_NAME} completed <<<<<<\n\nx==========x")
-except MyException as e:
-    logging.exception(e, sys)
-    raise e
+STAGES = [
+    (DATA_UPLOAD_STAGE_NAME, DataUploadPipeline),
+    (INGESTION_STAGE_NAME, DataIngestionPipeline),
+    (PRE_PROCESSING_STAGE_NAME, DataProcessingPipeline),
+    (MODEL_TRAINING_STAGE_NAME, ModelPipeline),
+]
 
-try:
-    logging.info(f">>>>>> stage {INGESTION_STAGE_NAME} started <<<<<<")
-    data_processing= DataIngestionPipeline()
-    data_processing.main()
-    logging.info(f">>>>>> stage {INGESTION_STAGE_NAME} completed <<<<<<\n\nx==========x")
-except MyException as e:
-    logging.exception(e, sys)
-    raise e
 
-try:
-    logging.info(f">>>>>> stage {PRE_PROCESSING_STAGE_NAME} started <<<<<<")
-    data_processing= DataProcessingPipeline()
-    data_processing.main()
-    logging.info(f">>>>>> stage {PRE_PROCESSING_STAGE_NAME} completed <<<<<<\n\nx==========x")
-except MyException as e:
-    logging.exception(e, sys)
-    raise e
+def run_from_disk(force: bool) -> None:
+    """Every stage reads its inputs from the artifacts the previous stage wrote, as standalone runs do."""
+    for stage_name, stage in STAGES:
+        run_stage(stage, stage_name, force=force)
+
+
+def run_in_memory(force: bool) -> None:
+    """
+    Each stage gets the previous stage's DataFrames directly instead of re-reading them, while the
+    preprocessing artifacts are written in the background. A stage that is skipped hands nothing
+    over, and the next one reads from disk.
+    """
+    cache = StageCache()
+    with ArtifactWriter() as writer:
+        run_stage(DataUploadPipeline, DATA_UPLOAD_STAGE_NAME, force=force, cache=cache)
+        data = run_stage(DataIngestionPipeline, INGESTION_STAGE_NAME, force=force, cache=cache)
+        splits = run_stage(DataProcessingPipeline, PRE_PROCESSING_STAGE_NAME, force=force, cache=cache,
+                           pending=writer, data=data, writer=writer)
+        run_stage(ModelPipeline, MODEL_TRAINING_STAGE_NAME, force=force, cache=cache, pending=writer, splits=splits)
+    logging.info("💾 All artifacts written")
+
+
+parser = argparse.ArgumentParser(description="Run the training pipeline, skipping stages whose inputs are unchanged.")
+parser.add_argument("--force", action="store_true", help="Run every stage even if its inputs are unchanged")
+parser.add_argument("--from-disk", action="store_true", help="Read every stage's inputs back from disk instead of "
+                                                             "handing DataFrames over in memory")
+args = parser.parse_args()
 
 try:
-    logging.info(f">>>>>> stage Model training started <<<<<<")
-    selection = ModelPipeline()
-    selection.main()
-    logging.info(f">>>>>> stage Model training completed <<<<<<\n\nx==========x")
+    if args.from_disk:
+        run_from_disk(args.force)
+    else:
+        run_in_memory(args.force)
 except MyException as e:
     logging.exception(e, sys)
-    raise e
\ No newline at end of file
+    raise e
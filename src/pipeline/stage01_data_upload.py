@@ -1,20 +1,45 @@
+import os
 import sys
 import pandas as pd
 from src.constants import *
+from src.config import CONFIG
 from src.components.data_upload import UploadData
 from src.logger import logging
 from src.exception import MyException
 
 class DataUploadPipeline:
+    # Inputs and outputs for the stage cache (src/pipeline/stage_cache.py). The dataset is
+    # identified by its URI: the download itself is what skipping this stage avoids.
+    CONFIG_SECTIONS = ["data_upload"]
+    CODE_MODULES = ["src.components.data_upload"]
+    ENV = ["DATASET_URI", "AWS_S3_BUCKET_NAME"]
+
     def __init__(self):
         pass
 
+    @staticmethod
+    def inputs():
+        return []
+
+    @staticmethod
+    def outputs():
+        config = CONFIG["data_upload"]
+        s3_key = f"{config.get('s3_upload_prefix', 'uploaded_data')}/{os.path.basename(config['nflx_csv_path'])}"
+        s3_object = f"s3://{os.getenv('AWS_S3_BUCKET_NAME')}/{s3_key}"
+        if config.get("stream", {}).get("enabled", False):
+            return [s3_object]
+        return [config["nflx_csv_path"], s3_object]
+
     @staticmethod
     def main():
         upload = UploadData()
         upload.download_file()
-        upload.extract_zip_file()
-        upload.upload_to_s3()
+        if CONFIG["data_upload"].get("stream", {}).get("enabled", False):
+            # Selected members go from the ZIP to S3 without being extracted
+            upload.stream_upload()
+        else:
+            upload.extract_zip_file()
+            upload.upload_to_s3()
 
 
 
@@ -1,18 +1,30 @@
+import os
 import sys
 from src.logger import logging
 from src.exception import MyException
 from src.components.data_ingestion import IngestData
 from src.constants import *
+from src.config import CONFIG
 
 class DataIngestionPipeline:
+    CONFIG_SECTIONS = ["data_ingest"]
+    CODE_MODULES = ["src.components.data_ingestion"]
+
     def __init__(self):
         pass
 
+    @staticmethod
+    def inputs():
+        return [f"s3://{os.getenv('AWS_S3_BUCKET_NAME')}/{CONFIG['data_ingest']['s3_data']}"]
+
+    @staticmethod
+    def outputs():
+        return [CONFIG["data_ingest"]["feature_store"]]
+
     @staticmethod
     def main():
         ingestor = IngestData()
-        ingestor.initiate_data_ingestion()
-        return
+        return ingestor.initiate_data_ingestion()
 
 
 if __name__ == '__main__':
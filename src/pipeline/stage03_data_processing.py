@@ -5,24 +5,52 @@ from src.config import CONFIG
 from src.logger import logging
 from src.exception import MyException
 from src.components.data_processing import DataPreprocess
+from src.components.artifacts import artifact_path
 
 class DataProcessingPipeline:
+    CONFIG_SECTIONS = ["data_ingest", "artifacts"]
+    CODE_MODULES = ["src.components.data_processing", "src.components.artifacts"]
+
     def __init__(self):
         pass
 
     @staticmethod
-    def main():
+    def inputs():
+        return [CONFIG["data_ingest"]["feature_store"]]
+
+    @staticmethod
+    def outputs():
+        config = CONFIG["data_ingest"]
+        return [artifact_path(config[name]) for name in ("processed_data_path", "TRAIN_FILE_NAME", "TEST_FILE_NAME",
+                                                         "TRAIN_LABEL_FILE_NAME", "TEST_LABEL_FILE_NAME")] \
+            + [config["scaler"]]
+
+    @staticmethod
+    def main(data: pd.DataFrame = None, writer=None):
+        """
+        ``data`` is the ingested frame when stage 2 ran in the same process; otherwise it is read
+        from the feature store. Returns the train/test splits for stage 4.
+        """
         config = CONFIG["data_ingest"]
-        
-        data = pd.read_csv(config["feature_store"])
+        streaming = config.get("streaming", {})
+
+        if streaming.get("enabled", False):
+            # Out of core: stage 4 reads the splits back from disk
+            logging.info(">>>>>Chunked Data Preprocessing Started...<<<<<")
+            DataPreprocess().process_in_chunks(streaming.get("chunk_size", 500000), streaming.get("test_size", 0.25))
+            logging.info(">>>>>Chunked Data Preprocessing Completed<<<<<\n")
+            return None
+
+        if data is None:
+            data = pd.read_csv(config["feature_store"])
 
         logging.info(">>>>>Data Preprocessing Started...<<<<<")
-        data_cleaning = DataPreprocess()
+        data_cleaning = DataPreprocess(writer=writer)
         data_cleaning.handle_data(data)
-        data_cleaning.split_data_as_train_test()
+        splits = data_cleaning.split_data_as_train_test()
         logging.info(">>>>>Data Preprocessing Completed<<<<<\n")
 
-        return 
+        return splits
 
 
 if __name__ == '__main__':
@@ -4,19 +4,42 @@ import pandas as pd
 from src.logger import logging
 from src.exception import MyException
 from src.components.model import ModelTraining
+from src.components.artifacts import artifact_path, load_frame
 from src.config import CONFIG
 class ModelPipeline:
+    CONFIG_SECTIONS = ["model_training", "artifacts"]
+    CODE_MODULES = ["src.components.model", "src.components.artifacts"]
+    ENV = ["AWS_S3_BUCKET_NAME"]
+
     def __init__(self):
         pass
 
     @staticmethod
-    def main():
-        
+    def inputs():
+        config = CONFIG["model_training"]
+        return [artifact_path(config[name]) for name in ("TRAIN_FILE_NAME", "TEST_FILE_NAME",
+                                                         "TRAIN_LABEL_FILE_NAME", "TEST_LABEL_FILE_NAME")] \
+            + [config["scaler"]]
+
+    @staticmethod
+    def outputs():
+        # The trained model only lives in S3; the local copy is removed after upload
+        config = CONFIG["model_training"]
+        s3_key = f"{config.get('s3_upload_prefix', 'models')}/{os.path.basename(config['model'])}"
+        return [f"s3://{os.getenv('AWS_S3_BUCKET_NAME')}/{s3_key}"]
+
+    @staticmethod
+    def main(splits: dict = None):
+        """``splits`` are stage 3's in-memory outputs when it ran in the same process."""
         config = CONFIG["model_training"]
-        X_train = pd.read_csv(config["TRAIN_FILE_NAME"])
-        X_test = pd.read_csv(config["TEST_FILE_NAME"])
-        y_train = pd.read_csv(config["TRAIN_LABEL_FILE_NAME"])
-        y_test = pd.read_csv(config["TEST_LABEL_FILE_NAME"])
+        if splits is not None:
+            X_train, X_test, y_train, y_test = (splits[name] for name in ("X_train", "X_test", "y_train", "y_test"))
+        else:
+            # Written by stage 3 in the artifacts.format from config.yaml; binary formats are memory-mapped
+            X_train = load_frame(config["TRAIN_FILE_NAME"])
+            X_test = load_frame(config["TEST_FILE_NAME"])
+            y_train = load_frame(config["TRAIN_LABEL_FILE_NAME"])
+            y_test = load_frame(config["TEST_LABEL_FILE_NAME"])
 
         logging.info(">>>>>Model Training Started...<<<<<")
         train = ModelTraining()
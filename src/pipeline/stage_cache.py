@@ -0,0 +1,164 @@
+"""
+Content-addressed skipping of pipeline stages.
+
+Each stage class declares what it reads and writes:
+
+    CONFIG_SECTIONS   config.yaml sections the stage depends on
+    CODE_MODULES      modules whose source is part of the stage's code version
+    ENV               environment variables that change what the stage does
+    inputs()          local paths or ``s3://bucket/key`` objects it reads
+    outputs()         local paths or ``s3://bucket/key`` objects it writes
+
+Before running a stage, ``run_stage`` hashes all of that into a fingerprint: SHA-256 of local
+files, the ETag of S3 objects, and the stage's own source plus ``CODE_MODULES``. If the
+fingerprint matches the stage's manifest from the last successful run, and every recorded
+output still exists unchanged, the stage is skipped. ``force=True`` always runs it.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+from botocore.exceptions import ClientError
+from src.config import CONFIG
+from src.logger import logging
+from src.exception import MyException
+from src.components.s3_transfer import s3_client
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class StageCache:
+    """Fingerprints stage inputs and outputs and keeps one manifest per stage."""
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir or CONFIG.get("stage_cache", {}).get("dir", "artifacts/stage_cache")
+        self._s3 = None
+        # File hashes keyed by path, reused while the file's size and mtime are unchanged
+        self._known_hashes = {}
+
+    def _manifest_path(self, stage) -> str:
+        return os.path.join(self.cache_dir, f"{stage.__name__}.json")
+
+    def load_manifest(self, stage) -> dict:
+        try:
+            with open(self._manifest_path(stage)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Files the last run hashed don't need to be read again if they weren't touched since
+        for path, known in manifest.get("files", {}).items():
+            self._known_hashes.setdefault(path, known)
+        return manifest
+
+    def _hash_file(self, path: str) -> str:
+        stat = os.stat(path)
+        known = self._known_hashes.get(path)
+        if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            return known["sha256"]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        self._known_hashes[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+        return digest.hexdigest()
+
+    def fingerprint(self, ref: str):
+        """Content hash of a local file or S3 object; None if it does not exist."""
+        if ref.startswith("s3://"):
+            bucket, _, key = ref[len("s3://"):].partition("/")
+            if self._s3 is None:
+                self._s3 = s3_client()
+            try:
+                return "etag:" + self._s3.head_object(Bucket=bucket, Key=key)["ETag"].strip('"')
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                    return None
+                raise
+        if not os.path.isfile(ref):
+            return None
+        return "sha256:" + self._hash_file(ref)
+
+    def stage_key(self, stage) -> dict:
+        """Everything that decides what the stage produces: config, environment, code and inputs."""
+        self.load_manifest(stage)
+        modules = [stage.__module__, *getattr(stage, "CODE_MODULES", [])]
+        code = hashlib.sha256()
+        for module in modules:
+            with open(importlib.util.find_spec(module).origin, "rb") as f:
+                code.update(f.read())
+        return {
+            "config": {section: CONFIG.get(section) for section in getattr(stage, "CONFIG_SECTIONS", [])},
+            "env": {name: os.getenv(name) for name in getattr(stage, "ENV", [])},
+            "code": code.hexdigest(),
+            "inputs": {ref: self.fingerprint(ref) for ref in stage.inputs()},
+        }
+
+    def is_fresh(self, stage, key: dict) -> bool:
+        manifest = self.load_manifest(stage)
+        if not manifest or manifest.get("key") != json.loads(json.dumps(key, default=str)):
+            return False
+        if any(fingerprint is None for fingerprint in key["inputs"].values()):
+            return False
+        # The stage must still write where the recorded run wrote (a changed bucket moves its S3 outputs)
+        if set(stage.outputs()) != set(manifest.get("outputs", {})):
+            return False
+        # The outputs must still be the ones the recorded run wrote
+        return all(self.fingerprint(ref) == fingerprint for ref, fingerprint in manifest["outputs"].items())
+
+    def record(self, stage, key: dict, elapsed: float) -> None:
+        outputs = {ref: self.fingerprint(ref) for ref in stage.outputs()}
+        local_refs = [ref for ref in [*key["inputs"], *outputs] if ref in self._known_hashes]
+        manifest = {
+            "stage": stage.__name__,
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+            "elapsed_s": round(elapsed, 3),
+            "key": key,
+            "outputs": outputs,
+            "files": {ref: self._known_hashes[ref] for ref in local_refs},
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self._manifest_path(stage) + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2, default=str)
+        os.replace(tmp_path, self._manifest_path(stage))
+
+
+def run_stage(stage, stage_name: str, force: bool = False, cache: StageCache = None, pending=None, **inputs):
+    """
+    Run ``stage.main(**inputs)`` unless its inputs, config and code match its last successful run.
+    Returns what the stage returned, or None if it was skipped.
+
+    ``pending`` is the ``ArtifactWriter`` of an in-process run. If it is still writing any of the
+    stage's inputs, the stage runs (its upstream just produced them), and the manifest is only
+    written once ``pending`` has flushed every file to disk.
+    """
+    try:
+        cache = cache or StageCache()
+        inputs_pending = pending is not None and pending.is_pending(stage.inputs())
+        key = None
+        if not inputs_pending:
+            key = cache.stage_key(stage)
+            if not force and cache.is_fresh(stage, key):
+                completed_at = cache.load_manifest(stage).get("completed_at")
+                logging.info(f"⏭️ Skipping stage {stage_name}: inputs, config and code unchanged since {completed_at}")
+                return None
+
+        logging.info(f">>>>>> stage {stage_name} started <<<<<<" + (" (forced)" if force else ""))
+        start = time.perf_counter()
+        result = stage.main(**inputs)
+        elapsed = time.perf_counter() - start
+
+        if pending is None:
+            cache.record(stage, key, elapsed)
+        else:
+            pending.after_flush(lambda: cache.record(stage, key or cache.stage_key(stage), elapsed))
+        logging.info(f">>>>>> stage {stage_name} completed in {elapsed:.1f}s <<<<<<\n\nx==========x")
+        return result
+    except MyException:
+        raise
+    except Exception as e:
+        raise MyException(e, sys)
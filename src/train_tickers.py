@@ -0,0 +1,35 @@
+"""
+Train one model per ticker in the dataset ZIP, in parallel.
+
+    python -m src.train_tickers --workers 8
+    python -m src.train_tickers --skip-upload --symbols NFLX AAPL
+
+Per-ticker artifacts, S3 prefixes and the summary table location come from ``tickers`` in
+config.yaml.
+"""
+import argparse
+import sys
+from src.constants import *
+from src.logger import logging
+from src.exception import MyException
+from src.components.multi_ticker import MultiTickerTraining
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Train one model per ticker symbol in a process pool.")
+    parser.add_argument("--workers", type=int, help="Training processes (default: tickers.workers, 0 = every CPU)")
+    parser.add_argument("--symbols", nargs="+", help="Only train these symbols")
+    parser.add_argument("--skip-upload", action="store_true", help="Use the ticker files already in S3 instead of "
+                                                                   "downloading and uploading the dataset")
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    try:
+        logging.info(f">>>>>> stage {MULTI_TICKER_STAGE_NAME} started <<<<<<")
+        MultiTickerTraining().run(symbols=args.symbols, workers=args.workers, upload=not args.skip_upload)
+        logging.info(f">>>>>> stage {MULTI_TICKER_STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except MyException as e:
+        logging.exception(e, sys)
+        raise e
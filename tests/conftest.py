@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The serving app imports its modules by bare name, as it does when run from app/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
@@ -0,0 +1,28 @@
+import asyncio
+
+import numpy as np
+
+from batching import MicroBatcher
+
+
+def test_stop_waits_for_batches_already_being_scored():
+    async def scenario():
+        started = asyncio.Event()
+
+        async def slow_predict(features):
+            started.set()
+            await asyncio.sleep(0.05)
+            return features[:, 0], "v1"
+
+        batcher = MicroBatcher(slow_predict, max_batch_size=2, max_wait_us=0)
+        batcher.start()
+        callers = [asyncio.create_task(batcher.submit(np.full((1, 8), i, dtype=np.float64))) for i in range(2)]
+        await started.wait()
+
+        await batcher.stop()
+
+        # Every caller already has its answer when stop() returns
+        assert all(caller.done() for caller in callers)
+        return [caller.result()[0].tolist() for caller in callers]
+
+    assert asyncio.run(scenario()) == [[0.0], [1.0]]
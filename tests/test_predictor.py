@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from predictor import CompiledLinearPredictor, compile_linear, make_predictor
+
+
+def _training_data(n_rows: int = 200, n_features: int = 8):
+    rng = np.random.default_rng(42)
+    X = rng.normal(loc=100.0, scale=25.0, size=(n_rows, n_features))
+    # A constant column: StandardScaler leaves its scale_ at 1.0 instead of dividing by zero
+    X[:, 3] = 7.5
+    y = X @ rng.normal(size=n_features) + 3.0 + rng.normal(scale=0.1, size=n_rows)
+    return X, y
+
+
+@pytest.mark.parametrize("with_mean,with_std", [(True, True), (False, True), (True, False), (False, False)])
+def test_compiled_linear_matches_pipeline_predict(with_mean, with_std):
+    X, y = _training_data()
+    model = Pipeline([("scaler", StandardScaler(with_mean=with_mean, with_std=with_std)),
+                      ("regressor", LinearRegression())]).fit(X, y)
+
+    compiled = compile_linear(model)
+
+    X_new = np.random.default_rng(7).normal(loc=100.0, scale=40.0, size=(64, X.shape[1]))
+    X_new[:5, 3] = [0.0, 7.5, -3.0, 1e4, 7.5]
+    assert np.allclose(compiled.predict(X_new), model.predict(X_new), rtol=1e-9, atol=1e-6)
+
+
+def test_make_predictor_keeps_compiled_path_for_scaled_linear_model():
+    X, y = _training_data()
+    model = Pipeline([("scaler", StandardScaler(with_mean=False)), ("regressor", LinearRegression())]).fit(X, y)
+
+    assert isinstance(make_predictor(model), CompiledLinearPredictor)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from schemas import FEATURE_NAMES, InferenceRequest
+
+ROW = [100.0, 105.0, 99.0, 104.0, 1_000_000.0, 2024.0, 5.0, 17.0]
+
+
+@pytest.mark.parametrize("inputs", [
+    [ROW[:-1] + [None]],
+    [ROW[:-1] + [float("nan")]],
+    [ROW, ROW[:-1] + [float("inf")]],
+    {name: value for name, value in zip(FEATURE_NAMES, ROW[:-1] + [float("-inf")])},
+])
+def test_non_finite_inputs_are_rejected(inputs):
+    with pytest.raises(ValidationError, match="finite"):
+        InferenceRequest(inputs=inputs)
+
+
+@pytest.mark.parametrize("inputs", [
+    {"open": 100.0, "High": 105.0},
+    [{"Open": 100.0, "Volumes": 5.0}],
+])
+def test_unknown_feature_names_are_rejected(inputs):
+    with pytest.raises(ValidationError, match="Unknown input names"):
+        InferenceRequest(inputs=inputs)
+
+
+def test_named_inputs_fill_omitted_features_with_defaults():
+    features = InferenceRequest(inputs={"Open": 100.0, "Volume": 5.0}).features
+
+    assert features.shape == (1, len(FEATURE_NAMES))
+    assert features[0, FEATURE_NAMES.index("Open")] == 100.0
+    assert np.isfinite(features).all()
@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from tensor_codec import decode_npy, encode_npy
+
+
+def test_npy_round_trip():
+    features = np.arange(16, dtype=np.float64).reshape(2, 8)
+
+    assert np.array_equal(decode_npy(encode_npy(features)), features)
+
+
+@pytest.mark.parametrize("truncate", [0, 20, -5])
+def test_empty_or_truncated_npy_raises_value_error(truncate):
+    body = encode_npy(np.ones((2, 8)))[:truncate]
+
+    with pytest.raises(ValueError, match="Invalid .npy body"):
+        decode_npy(body)